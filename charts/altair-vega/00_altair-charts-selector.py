@@ -53,10 +53,6 @@
 # More examples available at https://altair-viz.github.io/gallery/
 # -----------------------------------------------------------------------------
 
-import altair as alt
-from numpy import character
-from vega_datasets import data
-
 from trame.app import TrameApp
 from trame.decorators import change
 from trame.ui.vuetify3 import SinglePageLayout
@@ -82,6 +78,7 @@ class AltairChartsApp(TrameApp):
             {"title": "StreamGraph", "value": "StreamGraph"},
         ]
         self.state.active_chart = self.state.chart_options[0]["value"]
+        self._specs = {} # Vega-Lite dicts, built the first time a chart is selected
 
     def _build_ui(self):
         with SinglePageLayout(self.server) as layout:
@@ -106,9 +103,15 @@ class AltairChartsApp(TrameApp):
 
     # -------------------------------------------------------------------------
     # Chart generation methods
+    #
+    # altair and vega_datasets are imported on first use so that importing
+    # this module stays cheap.
     # -------------------------------------------------------------------------
 
     def ScatterMatrix(self):
+        import altair as alt
+        from vega_datasets import data
+
         source = data.cars()
         chart = (
             alt.Chart(source)
@@ -125,9 +128,12 @@ class AltairChartsApp(TrameApp):
             )
             .interactive()
         )
-        self.altair_figure.update(chart)
+        return chart
 
     def USIncomeByState(self):
+        import altair as alt
+        from vega_datasets import data
+
         states = alt.topo_feature(data.us_10m.url, "states")
         source = data.income.url
         chart = (
@@ -148,9 +154,12 @@ class AltairChartsApp(TrameApp):
             )
             .project(type="albersUsa")
         )
-        self.altair_figure.update(chart)
+        return chart
 
     def StackedDensityEstimates(self): # Method provided even if not in default options
+        import altair as alt
+        from vega_datasets import data
+
         source = data.iris()
         chart = (
             alt.Chart(source)
@@ -177,9 +186,12 @@ class AltairChartsApp(TrameApp):
                 height='container'
             )
         )
-        self.altair_figure.update(chart)
+        return chart
 
     def StreamGraph(self):
+        import altair as alt
+        from vega_datasets import data
+
         source = data.unemployment_across_industries.url
         chart = (
             alt.Chart(source)
@@ -198,7 +210,7 @@ class AltairChartsApp(TrameApp):
             )
             .interactive()
         )
-        self.altair_figure.update(chart)
+        return chart
 
     # -------------------------------------------------------------------------
     # Callbacks
@@ -208,9 +220,16 @@ class AltairChartsApp(TrameApp):
     def update_chart(self, active_chart=None, **kwargs):
         current_chart_selection = active_chart if active_chart is not None else self.state.active_chart
         
+        spec = self._specs.get(current_chart_selection)
+        if spec is not None:
+            self.state[self.altair_figure.key] = spec
+            return
+
         method_to_call = getattr(self, current_chart_selection, None)
         if method_to_call and callable(method_to_call):
-            method_to_call()
+            spec = method_to_call().to_dict()
+            self._specs[current_chart_selection] = spec
+            self.state[self.altair_figure.key] = spec
         else:
             print(f"Error: Chart method '{current_chart_selection}' not found.")
             if hasattr(self, 'altair_figure') and self.altair_figure:
@@ -49,20 +49,44 @@
 #
 #-------
 
-import matplotlib.pyplot as plt
+import asyncio
+import base64
+import io
+from collections import OrderedDict
+
+import matplotlib
+
+# Figures are only ever serialized for the browser, so skip any GUI backend
+matplotlib.use("Agg", force=True)
+# Let Agg drop more near-collinear vertices from long line paths
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+
 import numpy as np
+from matplotlib.figure import Figure
 
 from trame.app import TrameApp
 from trame.decorators import change
 from trame.ui.vuetify3 import SinglePageLayout
-from trame.widgets import vuetify3, trame
+from trame.widgets import html, vuetify3, trame
 from trame.widgets.matplotlib import Figure as MatplotlibFigure
 
+RESIZE_DEBOUNCE_SECONDS = 0.2 # Redraw only once the window stops resizing
+FIGURE_CACHE_SIZE = 16 # Serialized figures kept per (chart, size)
+
 
 class MatplotlibApp(TrameApp):
-    def __init__(self, server_name="MatplotlibApp"):
+    def __init__(self, server_name="MatplotlibApp", use_raster=False):
         super().__init__(server_name)
+        # use_raster sends a PNG rendered by Agg instead of the mpld3 (SVG)
+        # description, which is much cheaper for plots with many artists
+        self._use_raster = use_raster
+        self._resize_handle = None
+        self._fig_cache = OrderedDict()
+        self._figure_key = None
+        self._figures = {}
+        self._last_fig_kwargs = {} # figure name -> (figure_size(), raster scale) it was last shown at
         self._initialize_state()
+        self._initialize_data()
         self._build_ui()
         if self.state.active_figure:
              self._update_chart(self.state.active_figure)
@@ -79,6 +103,30 @@ class MatplotlibApp(TrameApp):
         self.state.active_figure = self.state.figures[0]["value"]
 
 
+    def _initialize_data(self):
+        # The plots use fixed seeds, so generate their data once rather than
+        # on every redraw
+        rng = np.random.RandomState(0)
+        self._first_demo_xy = [(rng.normal(size=100), rng.normal(size=100)) for _ in range(2)]
+
+        rng = np.random.RandomState(0)
+        self._subplot_data = [(rng.random_sample(3), rng.random_sample(30)) for _ in range(4)]
+
+        self._dots_y = np.random.rand(20)
+
+        rng = np.random.RandomState(0)
+        t = np.linspace(0, 10, 300)
+        x = np.sin(t)
+        dx = rng.normal(0, 0.3, 300)
+        # 25-point moving average through a running sum; matches
+        # np.convolve(x + dx, np.ones(25) / 25.0, mode="same") without the
+        # per-sample multiply-accumulate over the kernel
+        window = 25
+        padded = np.pad(x + dx, (window // 2, window // 2))
+        running_sum = np.cumsum(np.insert(padded, 0, 0.0))
+        x_smooth = (running_sum[window:] - running_sum[:-window]) / window
+        self._mwa = (t, x + dx, x_smooth, x)
+
     # -----------------------------------------------------------------------------
     # UI
     # -----------------------------------------------------------------------------
@@ -101,8 +149,11 @@ class MatplotlibApp(TrameApp):
             with layout.content:
                 with vuetify3.VContainer(fluid=True, classes="fill-height pa-0 ma-0"):
                     with trame.SizeObserver("figure_size"):
-                        html_figure = MatplotlibFigure(style="position: absolute; width: 100%; height: 100%;")
-                        self.ctrl.update_figure = html_figure.update
+                        if self._use_raster:
+                            self._figure_key = "figure_png"
+                            html.Img(src=(self._figure_key, None), style="position: absolute; width: 100%; height: 100%;")
+                        else:
+                            self._figure_key = MatplotlibFigure(style="position: absolute; width: 100%; height: 100%;").key
 
    # -----------------------------------------------------------------------------
     # Resize Handler
@@ -125,16 +176,32 @@ class MatplotlibApp(TrameApp):
     # -----------------------------------------------------------------------------
     # Plotting Methods
     # -----------------------------------------------------------------------------
+    def _reuse_figure(self, name):
+        # One Figure per chart. The chart content doesn't depend on the size,
+        # so an existing figure is only resized and its axes are kept as set
+        # up the first time. Figures are created outside of pyplot so there
+        # is no global registry to tear down.
+        # Returns (figure, True) when the caller still has to plot into it.
+        size = self.figure_size()
+        fig = self._figures.get(name)
+        if fig is None:
+            fig = Figure(**size)
+            self._figures[name] = fig
+            return fig, True
+
+        if size:
+            fig.set_size_inches(size["figsize"])
+            fig.set_dpi(size["dpi"])
+        return fig, False
+
     def FirstDemo(self):
-        plt.close("all")
-        fig, ax = plt.subplots(**self.figure_size())
-        np.random.seed(0)
-        ax.plot(
-            np.random.normal(size=100), np.random.normal(size=100), "or", ms=10, alpha=0.3
-        )
-        ax.plot(
-            np.random.normal(size=100), np.random.normal(size=100), "ob", ms=20, alpha=0.1
-        )
+        fig, is_new = self._reuse_figure("FirstDemo")
+        if not is_new:
+            return fig
+        ax = fig.subplots()
+        (x1, y1), (x2, y2) = self._first_demo_xy
+        ax.plot(x1, y1, "or", ms=10, alpha=0.3)
+        ax.plot(x2, y2, "ob", ms=20, alpha=0.1)
         ax.set_xlabel("this is x")
         ax.set_ylabel("this is y")
         ax.set_title("Matplotlib Plot Rendered in Trame!", size=14)
@@ -142,21 +209,26 @@ class MatplotlibApp(TrameApp):
         return fig
 
     def MultiLines(self):
-        plt.close("all")
-        fig, ax = plt.subplots(**self.figure_size())
+        fig, is_new = self._reuse_figure("MultiLines")
+        if not is_new:
+            return fig
+        ax = fig.subplots()
         x = np.linspace(0, 10, 1000)
-        for offset in np.linspace(0, 3, 7):
-            ax.plot(x, 0.9 * np.sin(x - offset), lw=5, alpha=0.4)
+        offsets = np.linspace(0, 3, 7)[:, None]
+        # One (7, 1000) sin evaluation and a single plot call for all 7 curves
+        ax.plot(x, 0.9 * np.sin(x - offsets).T, lw=5, alpha=0.4)
         ax.set_ylim(-1.2, 1.0)
         ax.text(5, -1.1, "Here are some curves", size=18)
         ax.grid(color="lightgray", alpha=0.7)
         return fig
 
     def DotsAndPoints(self):
-        plt.close("all")
-        fig, ax = plt.subplots(**self.figure_size())
+        fig, is_new = self._reuse_figure("DotsAndPoints")
+        if not is_new:
+            return fig
+        ax = fig.subplots()
         ax.plot(
-            np.random.rand(20),
+            self._dots_y,
             "-o",
             alpha=0.5,
             color="black",
@@ -172,36 +244,94 @@ class MatplotlibApp(TrameApp):
         return fig
 
     def MovingWindowAverage(self):
-        np.random.seed(0)
-        t = np.linspace(0, 10, 300)
-        x = np.sin(t)
-        dx = np.random.normal(0, 0.3, 300)
-        kernel = np.ones(25) / 25.0
-        x_smooth = np.convolve(x + dx, kernel, mode="same")
-        plt.close("all")
-        fig, ax = plt.subplots(**self.figure_size())
-        ax.plot(t, x + dx, linestyle="", marker="o", color="black", markersize=3, alpha=0.3)
+        t, x_noisy, x_smooth, x = self._mwa
+        fig, is_new = self._reuse_figure("MovingWindowAverage")
+        if not is_new:
+            return fig
+        ax = fig.subplots()
+        ax.plot(t, x_noisy, linestyle="", marker="o", color="black", markersize=3, alpha=0.3)
         ax.plot(t, x_smooth, "-k", lw=3)
         ax.plot(t, x, "--", lw=3, color="blue")
         return fig
 
     def Subplots(self):
-        plt.close("all")
-        fig = plt.figure(**self.figure_size())
+        fig, is_new = self._reuse_figure("Subplots")
+        if not is_new:
+            return fig
         fig.subplots_adjust(hspace=0.3)
-        np.random.seed(0)
-        for i in range(1, 5):
+        for i, (color, y) in enumerate(self._subplot_data, start=1):
             ax = fig.add_subplot(2, 2, i)
-            color = np.random.random(3)
-            ax.plot(np.random.random(30), lw=2, c=color)
+            ax.plot(y, lw=2, c=color)
             ax.set_title("RGB = ({0:.2f}, {1:.2f}, {2:.2f})".format(*color), size=14)
             ax.grid(color="lightgray", alpha=0.7)
         return fig
 
+    def _get_figure_data(self, name, plot_method):
+        # Serializing a figure for the client costs far more than plotting it,
+        # so keep the serialized form for each chart and size already shown
+        size = self.figure_size()
+        figsize = tuple(round(v, 2) for v in size.get("figsize", ()))
+        key = (name, figsize, size.get("dpi"), self._raster_scale())
+
+        data = self._fig_cache.get(key)
+        if data is not None:
+            self._fig_cache.move_to_end(key)
+            return data
+
+        data = self._serialize_figure(plot_method())
+        self._fig_cache[key] = data
+        if len(self._fig_cache) > FIGURE_CACHE_SIZE:
+            self._fig_cache.popitem(last=False)
+        return data
+
+    def _raster_scale(self):
+        # Device pixels per figure pixel in the PNG, clamped like figure_size();
+        # mpld3 output doesn't depend on it
+        if self._use_raster and self.state.figure_size and self.state.figure_size.get("pixelRatio", 1) > 1:
+            return 2
+        return 1
+
+    def _serialize_figure(self, fig):
+        if not self._use_raster:
+            return MatplotlibFigure.to_data(fig)
+
+        # Render at device resolution so the image stays sharp on HiDPI screens
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=fig.dpi * self._raster_scale())
+        return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
     # -----------------------------------------------------------------------------
     # Callbacks
     # -----------------------------------------------------------------------------
-    @change("active_figure", "figure_size")
+    @change("figure_size")
+    def _on_figure_size_change(self, **kwargs):
+        # A window resize emits a burst of size events; coalesce them into a
+        # single redraw once the size settles
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._resize_chart()
+            return
+
+        if self._resize_handle is not None:
+            self._resize_handle.cancel()
+        self._resize_handle = loop.call_later(RESIZE_DEBOUNCE_SECONDS, self._flush_resize)
+
+    def _flush_resize(self):
+        self._resize_handle = None
+        with self.state:
+            self._resize_chart()
+
+    def _resize_chart(self):
+        # Size events that change neither the figure geometry nor the PNG
+        # scale (e.g. a pixelRatio change hidden by the 2x clamp) leave the
+        # current chart as is
+        active_figure = self.state.active_figure
+        if (self.figure_size(), self._raster_scale()) == self._last_fig_kwargs.get(active_figure):
+            return
+        self._update_chart(active_figure)
+
+    @change("active_figure")
     def _update_chart(self, active_figure, **kwargs):
         if not active_figure: # active_figure might be None initially or if state is cleared
             return
@@ -209,9 +339,9 @@ class MatplotlibApp(TrameApp):
         method_name = active_figure
         if hasattr(self, method_name) and callable(getattr(self, method_name)):
             plot_method = getattr(self, method_name)
-            fig = plot_method()
-            if hasattr(self.ctrl, 'update_figure') and self.ctrl.update_figure:
-                 self.ctrl.update_figure(fig)
+            if self._figure_key is not None:
+                self.state[self._figure_key] = self._get_figure_data(method_name, plot_method)
+                self._last_fig_kwargs[method_name] = (self.figure_size(), self._raster_scale())
         else:
             print(f"Error: Plotting method {method_name} not found for active_figure='{active_figure}'")
 
@@ -35,6 +35,8 @@
 #   # Access via the URLs provided in the console (e.g., http://localhost:8080)
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
+import functools
+
 from trame.app import TrameApp
 from trame.decorators import change
 from trame.ui.vuetify3 import SinglePageLayout
@@ -43,44 +45,56 @@ from trame.widgets import vuetify3, plotly
 import plotly.express as px
 import plotly.graph_objects as go
 
-# Sample Plotly figures
-SCATTER_MATRIX = px.scatter_matrix(
-    px.data.iris(),
-    dimensions=["sepal_width", "sepal_length", "petal_width", "petal_length"],
-    color="species",
-)
-SCATTER_3D = px.scatter_3d(
-    px.data.iris(),
-    x="sepal_length",
-    y="sepal_width",
-    z="petal_width",
-    color="petal_length",
-    symbol="species",
-)
-BAR_CHART = go.Figure(
-    data=[go.Bar(x=[1, 2, 3], y=[1, 3, 2])], layout_title_text="A Bar Chart"
-)
-CONTOUR_PLOT = go.Figure(
-    data=[
-        go.Contour(
-            z=[
-                [10, 10.625, 12.5, 15.625, 20],
-                [5.625, 6.25, 8.125, 11.25, 15.625],
-                [2.5, 3.125, 5.0, 8.125, 12.5],
-                [0.625, 1.25, 3.125, 6.25, 10.625],
-                [0, 0.625, 2.5, 5.625, 10],
-            ]
-        )
-    ]
-)
-CONTOUR_PLOT.update_layout(title_text="Contour Plot")
+# Sample Plotly figures, built on first use so importing the module stays cheap
+PLOT_NAMES = ["Contour", "Scatter3D", "ScatterMatrix", "BarChart"]
+
+@functools.lru_cache(maxsize=1)
+def get_plots():
+    iris = px.data.iris()
+    scatter_matrix = px.scatter_matrix(
+        iris,
+        dimensions=["sepal_width", "sepal_length", "petal_width", "petal_length"],
+        color="species",
+    )
+    scatter_3d = px.scatter_3d(
+        iris,
+        x="sepal_length",
+        y="sepal_width",
+        z="petal_width",
+        color="petal_length",
+        symbol="species",
+    )
+    bar_chart = go.Figure(
+        data=[go.Bar(x=[1, 2, 3], y=[1, 3, 2])], layout_title_text="A Bar Chart"
+    )
+    contour_plot = go.Figure(
+        data=[
+            go.Contour(
+                z=[
+                    [10, 10.625, 12.5, 15.625, 20],
+                    [5.625, 6.25, 8.125, 11.25, 15.625],
+                    [2.5, 3.125, 5.0, 8.125, 12.5],
+                    [0.625, 1.25, 3.125, 6.25, 10.625],
+                    [0, 0.625, 2.5, 5.625, 10],
+                ]
+            )
+        ]
+    )
+    contour_plot.update_layout(title_text="Contour Plot")
+
+    return {
+        "Contour": contour_plot,
+        "Scatter3D": scatter_3d,
+        "ScatterMatrix": scatter_matrix,
+        "BarChart": bar_chart,
+    }
 
-PLOTS = {
-    "Contour": CONTOUR_PLOT,
-    "Scatter3D": SCATTER_3D,
-    "ScatterMatrix": SCATTER_MATRIX,
-    "BarChart": BAR_CHART,
-}
+@functools.lru_cache(maxsize=len(PLOT_NAMES))
+def get_plot_data(name):
+    # Encode each figure for the client once; switching back to a plot then
+    # reuses the same payload instead of re-running to_plotly_json()
+    figure = get_plots().get(name)
+    return plotly.Figure.to_data(figure) if figure else None
 
 # -----------------------------------------------------------------------------
 # Trame Application
@@ -93,9 +107,9 @@ class PlotlyViewer(TrameApp):
 
     @change("active_plot_name")
     def update_plot_figure(self, active_plot_name, **_):
-        figure_data = PLOTS.get(active_plot_name)
+        figure_data = get_plot_data(active_plot_name)
         if figure_data:
-            self.ctx.plotly_display.update(figure_data)
+            self.state[self.ctx.plotly_display.key] = figure_data
 
     def _build_ui(self):
         with SinglePageLayout(self.server, full_height=True) as self.ui:
@@ -106,7 +120,7 @@ class PlotlyViewer(TrameApp):
                 vuetify3.VSpacer()
                 vuetify3.VSelect(
                     v_model=("active_plot_name", "Contour"),
-                    items=("plots", list(PLOTS.keys())),
+                    items=("plots", PLOT_NAMES),
                     hide_details=True,
                     density="compact",
                     style="max-width: 200px;",
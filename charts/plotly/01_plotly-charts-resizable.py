@@ -6,6 +6,7 @@
 #     "trame-plotly",
 #     "plotly",
 #     "pandas",
+#     "numpy",
 # ]
 # ///
 # -----------------------------------------------------------------------------
@@ -22,7 +23,7 @@
 #
 # Required Packages:
 #   (Handled by the script block above if using uv run)
-#   pip install "trame[app]" trame-vuetify trame-plotly plotly pandas
+#   pip install "trame[app]" trame-vuetify trame-plotly plotly pandas numpy
 #
 # Run as a Desktop Application:
 #   python 01_plotly-charts-resizable.py --app
@@ -42,6 +43,7 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
+#     "numpy",
 #     "pandas",
 #     "plotly",
 #     "trame-plotly",
@@ -50,6 +52,11 @@
 # ]
 # ///
 # -----------------------------------------------------------------------------
+import functools
+import itertools
+import urllib.request
+from pathlib import Path
+
 from trame.app import TrameApp
 from trame.decorators import change, TrameApp as TrameAppDecorator
 from trame.ui.vuetify3 import SinglePageLayout
@@ -57,15 +64,39 @@ from trame.widgets import vuetify3, plotly
 
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 
 # Data for new charts from trame-plotly example
-contour_raw_data = pd.read_json(
-    "https://raw.githubusercontent.com/plotly/datasets/master/contour_data.json"
-)
-polar_data = pd.read_csv(
-    "https://raw.githubusercontent.com/plotly/datasets/master/polar_dataset.csv"
-)
+CONTOUR_DATA_URL = "https://raw.githubusercontent.com/plotly/datasets/master/contour_data.json"
+POLAR_DATA_URL = "https://raw.githubusercontent.com/plotly/datasets/master/polar_dataset.csv"
+DATA_CACHE_DIR = Path.home() / ".cache" / "trame-plotly-example"
+
+def fetch_data_file(url):
+    """Download a dataset once and reuse the local copy on later runs"""
+    data_file = DATA_CACHE_DIR / url.rsplit("/", 1)[-1]
+    if not data_file.exists():
+        DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = data_file.with_suffix(".part")
+        urllib.request.urlretrieve(url, tmp_file)
+        tmp_file.replace(data_file)
+    return data_file
+
+# Datasets are loaded the first time a chart needs them, not at import
+@functools.lru_cache(maxsize=1)
+def load_contour_data():
+    """Parse the ternary regions once into (label, a, b, c) closed outlines"""
+    contour_dict = pd.read_json(fetch_data_file(CONTOUR_DATA_URL))["Data"]
+    regions = []
+    for raw_data in contour_dict:
+        label, points = clean_data(raw_data)
+        a, b, c = np.vstack([points, points[:1]]).T  # Closing the loop
+        regions.append((label, a, b, c))
+    return regions
+
+@functools.lru_cache(maxsize=1)
+def load_polar_data():
+    return pd.read_csv(fetch_data_file(POLAR_DATA_URL))
 
 # Helper function from trame-plotly example
 def clean_data(data_in):
@@ -74,59 +105,56 @@ def clean_data(data_in):
     used for drawing traces. Takes a dictionary as the
     input, and returns a list in the following format:
 
-    input = {'key': ['a b c']}
-    output = [key, [a, b, c]]
+    input = {'key': ['a b c', 'd e f']}
+    output = (key, array([[a, b, c], [d, e, f]]))
     """
-    key = list(data_in.keys())[0]
-    data_out = [key]
-    for i in data_in[key]:
-        data_out.append(list(map(float, i.split(" "))))
-    return data_out
+    key = next(iter(data_in))
+    rows = data_in[key]
+    # Parse every row in one pass instead of splitting and converting per row
+    points = np.array(" ".join(rows).split(), dtype=float).reshape(len(rows), -1)
+    return key, points
 
-# Chart creation functions from trame-plotly example
+# Chart creation functions from trame-plotly example. The figures only depend on
+# the static datasets, so each is built once and shared by every app instance.
+@functools.lru_cache(maxsize=1)
 def create_ternary_fig(**kwargs):
-    contour_dict = contour_raw_data["Data"]
     colors = [
         "#8dd3c7", "#ffffb3", "#bebada", "#fb8072", "#80b1d3",
         "#fdb462", "#b3de69", "#fccde5", "#d9d9d9", "#bc80bd",
     ]
-    colors_iterator = iter(colors)
+    colors_iterator = itertools.cycle(colors)  # Reuse the palette if there are more regions
     fig = go.Figure()
-    for raw_data in contour_dict:
-        data = clean_data(raw_data)
-        a = [inner_data[0] for inner_data in data[1:]]
-        a.append(data[1][0])  # Closing the loop
-        b = [inner_data[1] for inner_data in data[1:]]
-        b.append(data[1][1])  # Closing the loop
-        c = [inner_data[2] for inner_data in data[1:]]
-        c.append(data[1][2])  # Closing the loop
+    for label, a, b, c in load_contour_data():
         fig.add_trace(
             go.Scatterternary(
-                text=data[0], a=a, b=b, c=c, mode="lines",
+                text=label, a=a, b=b, c=c, mode="lines",
                 line=dict(color="#444", shape="spline"),
-                fill="toself", fillcolor=colors_iterator.__next__(),
+                fill="toself", fillcolor=next(colors_iterator),
             )
         )
     fig.update_layout(margin=dict(l=50, r=50, t=50, b=50), title_text="Ternary Chart")
     return fig
 
+@functools.lru_cache(maxsize=1)
 def create_polar_fig(**kwargs):
+    polar_data = load_polar_data()
+    theta = polar_data["y"].to_numpy()
     fig = go.Figure()
     fig.add_trace(
         go.Scatterpolar(
-            r=polar_data["x1"].tolist(), theta=polar_data["y"].tolist(),
+            r=polar_data["x1"].to_numpy(), theta=theta,
             mode="lines", name="Figure 8", line_color="peru",
         )
     )
     fig.add_trace(
         go.Scatterpolar(
-            r=polar_data["x2"].tolist(), theta=polar_data["y"].tolist(),
+            r=polar_data["x2"].to_numpy(), theta=theta,
             mode="lines", name="Cardioid", line_color="darkviolet",
         )
     )
     fig.add_trace(
         go.Scatterpolar(
-            r=polar_data["x3"].tolist(), theta=polar_data["y"].tolist(),
+            r=polar_data["x3"].to_numpy(), theta=theta,
             mode="lines", name="Hypercardioid", line_color="deepskyblue",
         )
     )
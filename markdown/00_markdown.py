@@ -45,7 +45,7 @@
 #
 # ---
 
-import os
+import asyncio
 from pathlib import Path
 
 from trame.app import TrameApp, get_server
@@ -63,9 +63,13 @@ class MarkdownViewerApp(TrameApp):
             server if server else get_server(client_type="vue3"),
             name="MarkdownViewer"
         )
+        self._md_cache = {} # path -> (mtime, text)
         self._initialize_state()
+        md_directory = Path(__file__).parent.resolve()
+        self._md_paths = {name: md_directory / name for name in self.state.file_options}
         self._build_ui()
-        self.update_markdown_content() # Initial content load
+        # No initial load here: @change("file_name") fires when the state
+        # becomes ready and fills md_content then
 
     def _initialize_state(self):
         self.state.file_name = "demo.md"
@@ -73,19 +77,30 @@ class MarkdownViewerApp(TrameApp):
         self.state.md_content = "" # Initialize with empty string or placeholder
         self.state.trame__title = "Markdown Viewer (Trame 3)"
 
+    def _read_markdown(self, file_name):
+        md_file_path = self._md_paths.get(file_name)
+        if md_file_path is None:
+            md_file_path = Path(__file__).parent.resolve() / file_name
+
+        try:
+            # Re-selecting an unchanged file is served from memory
+            mtime = md_file_path.stat().st_mtime
+            cached = self._md_cache.get(md_file_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            content = md_file_path.read_text(encoding="utf-8")
+        except OSError:
+            return f"# Error\nCould not find or read '{file_name}' at '{md_file_path}'."
+
+        self._md_cache[md_file_path] = (mtime, content)
+        return content
+
     @change("file_name")
-    def update_markdown_content(self, file_name=None, **kwargs):
-        if file_name is None:
-            file_name = self.state.file_name
-        
-        current_script_path = Path(__file__).parent.resolve()
-        md_file_path = current_script_path / file_name
-
-        if md_file_path.exists() and md_file_path.is_file():
-            with open(md_file_path, encoding="utf-8") as f:
-                self.state.md_content = f.read()
-        else:
-            self.state.md_content = f"# Error\nCould not find or read '{file_name}' at '{md_file_path}'."
+    async def update_markdown_content(self, file_name, **kwargs):
+        # Read in a worker thread so slow disks don't block the server loop
+        content = await asyncio.to_thread(self._read_markdown, file_name)
+        with self.state:
+            self.state.md_content = content
 
     def _build_ui(self):
         with SinglePageLayout(self.server) as layout:
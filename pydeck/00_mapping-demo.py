@@ -35,9 +35,11 @@
 #   python 00_mapping-demo.py --server
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
+import functools
 import os
-import pandas as pd
-import pydeck as pdk
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from trame.app import TrameApp
 from trame.decorators import change
@@ -46,63 +48,136 @@ from trame.widgets import deckgl, vuetify3
 
 # -----------------------------------------------------------------------------
 # Data and Layer Definitions
+#
+# pandas/pydeck are imported and the datasets loaded when the first app is
+# created, so importing this module has no network or heavy import cost.
 # -----------------------------------------------------------------------------
 
+DATA_URL = (
+    "https://raw.githubusercontent.com/streamlit/"
+    "example-data/master/hello/v1/%s"
+)
+DATA_CACHE_DIR = Path.home() / ".cache" / "trame-deckgl"
+COORD_COLUMNS = ["lon", "lat", "lon2", "lat2"]
+COORD_DECIMALS = 5 # ~1 m
+
+# Declared column types, so read_json doesn't have to infer them. Coordinates
+# stay float64: pydeck sends them as Python floats, and float32 values would
+# only print as longer decimals.
+DATA_SCHEMAS = {
+    "bart_stop_stats.json": {"exits": "int32"},
+    "bart_path_stats.json": {"outbound": "int32"},
+}
+
+@functools.lru_cache(maxsize=None)
 def from_data_file(filename):
-    url = (
-        "https://raw.githubusercontent.com/streamlit/"
-        "example-data/master/hello/v1/%s" % filename
-    )
-    return pd.read_json(url)
-
-ALL_LAYERS = {
-    "Bike Rentals": pdk.Layer(
-        "HexagonLayer",
-        data=from_data_file("bike_rental_stats.json"),
-        get_position=["lon", "lat"],
-        radius=200,
-        elevation_scale=4,
-        elevation_range=[0, 1000],
-        extruded=True,
-    ),
-    "Bart Stop Exits": pdk.Layer(
-        "ScatterplotLayer",
-        data=from_data_file("bart_stop_stats.json"),
-        get_position=["lon", "lat"],
-        get_fill_color=[200, 30, 0, 160],
-        get_radius="[exits]",
-        radius_scale=0.05,
-    ),
-    "Bart Stop Names": pdk.Layer(
-        "TextLayer",
-        data=from_data_file("bart_stop_stats.json"),
-        get_position=["lon", "lat"],
-        get_text="name",
-        get_color=[0, 0, 0, 200],
-        get_size=15,
-        get_alignment_baseline="'bottom'",
-    ),
-    "Outbound Flow": pdk.Layer(
-        "ArcLayer",
-        data=from_data_file("bart_path_stats.json"),
-        get_source_position=["lon", "lat"],
-        get_target_position=["lon2", "lat2"],
-        get_source_color=[200, 30, 0, 160],
-        get_target_color=[200, 30, 0, 160],
-        auto_highlight=True,
-        width_scale=0.0001,
-        get_width="outbound",
-        width_min_pixels=3,
-        width_max_pixels=30,
-    ),
+    """Download a dataset once and reuse the local copy on later runs"""
+    import pandas as pd
+
+    data_file = DATA_CACHE_DIR / filename
+    if not data_file.exists():
+        DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = data_file.with_suffix(".part")
+        urllib.request.urlretrieve(DATA_URL % filename, tmp_file)
+        tmp_file.replace(data_file)
+    data = pd.read_json(data_file, orient="records", dtype=DATA_SCHEMAS.get(filename, True))
+
+    # Rounded coordinates are plenty for the map and keep the numbers short
+    # in the JSON sent to deck.gl
+    coords = data.columns.intersection(COORD_COLUMNS)
+    data[coords] = data[coords].round(COORD_DECIMALS)
+
+    # Dictionary-encode other repeated strings so the layer records share one
+    # str object per distinct value
+    for column in data.select_dtypes(include=["object", "string"]):
+        if data[column].nunique() < 0.5 * len(data):
+            data[column] = data[column].astype("category")
+    return data
+
+DATA_FILES = ["bike_rental_stats.json", "bart_stop_stats.json", "bart_path_stats.json"]
+
+@functools.lru_cache(maxsize=1)
+def load_layers():
+    import pydeck as pdk
+
+    # Download the datasets in parallel; the two BART stop layers share one frame
+    with ThreadPoolExecutor(max_workers=len(DATA_FILES)) as pool:
+        data = dict(zip(DATA_FILES, pool.map(from_data_file, DATA_FILES)))
+    stops = data["bart_stop_stats.json"]
+    paths = data["bart_path_stats.json"]
+
+    # Each layer only gets the columns its accessors read, so the records
+    # sent to the client carry no unused keys. The hexagon layer only needs
+    # positions and takes plain [lon, lat] pairs read with get_position="-".
+    return {
+        "Bike Rentals": pdk.Layer(
+            "HexagonLayer",
+            data=data["bike_rental_stats.json"][["lon", "lat"]].to_numpy().tolist(),
+            get_position="-",
+            radius=200,
+            elevation_scale=4,
+            elevation_range=[0, 1000],
+            extruded=True,
+        ),
+        "Bart Stop Exits": pdk.Layer(
+            "ScatterplotLayer",
+            data=stops[["lon", "lat", "exits"]],
+            get_position=["lon", "lat"],
+            get_fill_color=[200, 30, 0, 160],
+            get_radius="[exits]",
+            radius_scale=0.05,
+        ),
+        "Bart Stop Names": pdk.Layer(
+            "TextLayer",
+            data=stops[["lon", "lat", "name"]],
+            get_position=["lon", "lat"],
+            get_text="name",
+            get_color=[0, 0, 0, 200],
+            get_size=15,
+            get_alignment_baseline="'bottom'",
+        ),
+        "Outbound Flow": pdk.Layer(
+            "ArcLayer",
+            data=paths[["lon", "lat", "lon2", "lat2", "outbound"]],
+            get_source_position=["lon", "lat"],
+            get_target_position=["lon2", "lat2"],
+            get_source_color=[200, 30, 0, 160],
+            get_target_color=[200, 30, 0, 160],
+            auto_highlight=True,
+            width_scale=0.0001,
+            get_width="outbound",
+            width_min_pixels=3,
+            width_max_pixels=30,
+        ),
+    }
+
+LAYER_NAMES = ("Bike Rentals", "Bart Stop Exits", "Bart Stop Names", "Outbound Flow")
+
+INITIAL_VIEW_STATE = {
+    "latitude": 37.76,
+    "longitude": -122.4,
+    "zoom": 11,
+    "pitch": 50,
 }
 
-DEFAULT_LAYERS = [
-    "Bike Rentals",
-    "Bart Stop Exits",
-    "Bart Stop Names",
-    "Outbound Flow",
-]
+DEFAULT_LAYERS = list(LAYER_NAMES)
+
+@functools.lru_cache(maxsize=1)
+def load_deck_data():
+    """Serialize the deck and every layer once; toggles only pick layers"""
+    import pydeck as pdk
+
+    layers = load_layers()
+    deck = pdk.Deck(
+        map_provider="mapbox",
+        map_style="mapbox://styles/mapbox/light-v9", # or another style
+        initial_view_state=INITIAL_VIEW_STATE,
+        layers=list(layers.values()),
+        # tooltip=True # Optional: enable default tooltip
+    )
+    deck_data = deckgl.Deck.to_data(deck)
+    layer_data = dict(zip(layers, deck_data.pop("layers")))
+    return deck_data, layer_data
 
 # -----------------------------------------------------------------------------
 # Mapbox API Key Information
@@ -125,6 +200,7 @@ class MappingDemoApp(TrameApp):
         super().__init__(server, client_type="vue3")
         self.state.activeLayers = DEFAULT_LAYERS[:]  # Use a copy
         self._deck_widget = None  # To store the deck widget instance
+        self._deck_data, self._layer_data = load_deck_data()
         self._build_ui()
         self.update_map() # Initial map rendering
 
@@ -133,44 +209,18 @@ class MappingDemoApp(TrameApp):
         if activeLayers is None: # Handle initial call from __init__
             activeLayers = self.state.activeLayers
 
+        # Layers are drawn in the order the user picked them
         selected_layers = [
-            layer
-            for layer_name, layer in ALL_LAYERS.items()
-            if layer_name in activeLayers
+            self._layer_data[layer_name]
+            for layer_name in activeLayers
+            if layer_name in self._layer_data
         ]
 
         if self._deck_widget:
-            if selected_layers:
-                deck = pdk.Deck(
-                    map_provider="mapbox",
-                    map_style="mapbox://styles/mapbox/light-v9", # or another style
-                    initial_view_state={
-                        "latitude": 37.76,
-                        "longitude": -122.4,
-                        "zoom": 11,
-                        "pitch": 50,
-                    },
-                    layers=selected_layers,
-                    # tooltip=True # Optional: enable default tooltip
-                )
-                self._deck_widget.update(deck)
-            else:
-                # Clear the map or show a placeholder if no layers are selected
-                # For simplicity, we'll update with an empty list of layers
-                deck = pdk.Deck(
-                    map_provider="mapbox",
-                    map_style="mapbox://styles/mapbox/light-v9",
-                    initial_view_state={
-                        "latitude": 37.76,
-                        "longitude": -122.4,
-                        "zoom": 11,
-                        "pitch": 50,
-                    },
-                    layers=[],
-                )
-                self._deck_widget.update(deck)
-                print("No layers selected. Map cleared.")
-
+            # Only the layer list changes between updates, so splice the
+            # already serialized layers into the serialized deck; an empty
+            # selection simply clears the map
+            self.state[self._deck_widget.key] = {**self._deck_data, "layers": selected_layers}
 
     def _build_ui(self):
         with SinglePageLayout(self.server, full_height=True) as self.ui:
@@ -181,7 +231,7 @@ class MappingDemoApp(TrameApp):
                 vuetify3.VSpacer()
                 vuetify3.VSelect(
                     v_model=("activeLayers",), # Binds to self.state.activeLayers
-                    items=("available_layers", list(ALL_LAYERS.keys())),
+                    items=("available_layers", LAYER_NAMES),
                     label="Select Layers",
                     multiple=True,
                     chips=True,
@@ -5,7 +5,6 @@
 #     "trame-vuetify",
 #     "trame-deckgl",
 #     "trame-vega",
-#     "altair==5.1.2",
 #     "pandas",
 #     "pydeck",
 #     "numpy",
@@ -15,7 +14,7 @@
 # Trame Deck.gl and Vega Uber Pickups Demo (Trame 3 / Vue 3)
 #
 # This example visualizes Uber pickup data in New York City using Deck.gl for
-# hexagonal heatmaps and Vega (via Altair) for a histogram of pickups by minute.
+# hexagonal heatmaps and Vega-Lite for a histogram of pickups by minute.
 # It demonstrates how to integrate these libraries within a Trame 3 application
 # with a Vue 3 frontend, following modern coding practices.
 #
@@ -25,7 +24,7 @@
 #
 # Required Packages:
 #   (Handled by the script block above if using uv run)
-#   pip install "trame[app]" trame-vuetify trame-deckgl trame-vega altair==5.1.2 pandas pydeck numpy
+#   pip install "trame[app]" trame-vuetify trame-deckgl trame-vega pandas pydeck numpy
 #
 # To run as a Desktop Application:
 #   python 01_uber-nyc-pickups.py --app
@@ -44,14 +43,18 @@
 #
 # IMPORTANT: Set your MAPBOX_API_KEY environment variable for the maps to render.
 # Example: export MAPBOX_API_KEY="your_actual_mapbox_api_key_here"
+#
+# The pickup CSV is downloaded on first run and cached in ~/.cache/trame-uber/.
 # -----------------------------------------------------------------------------
 # -----------------------------------------------------------------------------
 
+import asyncio
 import os
-import altair as alt
+import urllib.request
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
-import pydeck as pdk
 
 from trame.app import TrameApp
 from trame.decorators import change
@@ -65,16 +68,54 @@ DATE_TIME = "date/time"
 DATA_URL = (
     "http://s3-us-west-2.amazonaws.com/streamlit-demo-data/uber-raw-data-sep14.csv.gz"
 )
+DATA_CACHE_FILE = Path.home() / ".cache" / "trame-uber" / "uber-raw-data-sep14.csv.gz"
 DEFAULT_PICKUP_HOUR = 10 # A common default hour
+SLIDER_DEBOUNCE_SECONDS = 0.12 # Only redraw once the slider settles
+
+# Vega-Lite spec for the per-minute histogram. Only "data" and "title" change
+# with the selected hour, so the rest is written out once instead of rebuilt
+# through Altair.
+HIST_SPEC = {
+    "$schema": "https://vega.github.io/schema/vega-lite/v5.15.1.json",
+    "config": {
+        "view": {"continuousWidth": 300, "continuousHeight": 300, "strokeWidth": 0},
+        "axis": {"grid": False},
+        "title": {"anchor": "middle", "fontSize": 14},
+    },
+    "mark": {"type": "area", "color": "#1E88E5", "interpolate": "step-after", "line": True},
+    "encoding": {
+        "x": {"field": "minute", "type": "quantitative", "scale": {"nice": False}, "title": "Minute of the Hour"},
+        "y": {"field": "pickups", "type": "quantitative", "title": "Number of Pickups"},
+        "tooltip": [
+            {"field": "minute", "type": "quantitative", "title": "Minute"},
+            {"field": "pickups", "type": "quantitative", "title": "Pickups"},
+        ],
+    },
+    "width": "container",
+    "height": 150,
+}
 
-def lowercase(x):
-    return str(x).lower()
+def fetch_data_file():
+    """Download the CSV once and reuse the local copy on later runs"""
+    if not DATA_CACHE_FILE.exists():
+        DATA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = DATA_CACHE_FILE.with_suffix(".part")
+        urllib.request.urlretrieve(DATA_URL, tmp_file)
+        tmp_file.replace(DATA_CACHE_FILE)
+    return DATA_CACHE_FILE
 
 def load_data(nrows):
     try:
-        data = pd.read_csv(DATA_URL, nrows=nrows)
-        data.rename(lowercase, axis="columns", inplace=True)
-        data[DATE_TIME] = pd.to_datetime(data[DATE_TIME])
+        # Parse dates and narrow dtypes while reading instead of in extra passes
+        data = pd.read_csv(
+            fetch_data_file(),
+            nrows=nrows,
+            usecols=["Date/Time", "Lat", "Lon"],
+            dtype={"Lat": "float32", "Lon": "float32"},
+            parse_dates=["Date/Time"],
+            date_format="%m/%d/%Y %H:%M:%S",
+        )
+        data.columns = data.columns.str.lower()
         return data
     except Exception as e:
         print(f"Error loading data from {DATA_URL}: {e}")
@@ -90,13 +131,48 @@ class UberPickupsApp(TrameApp):
         super().__init__(server_name, client_type="vue3")
         self.state.pickupHour = DEFAULT_PICKUP_HOUR
         self.state.loading = True
-        self._data_cache = load_data(100000) # Load data once
-        if self._data_cache.empty:
+        data = load_data(100000) # Load data once; only the arrays below are kept
+        if data.empty:
             print("Warning: Data cache is empty. Check data loading.")
 
+        # Columnar copies of what the slider callback needs
+        if data.empty or DATE_TIME not in data.columns:
+            self._hour_arr = np.empty(0, dtype=np.int8)
+            self._minute_arr = np.empty(0, dtype=np.int8)
+            self._lonlat = np.empty((0, 2), dtype=np.float32)
+        else:
+            # Timestamps are naive, so plain integer math on minutes since the
+            # epoch gives hour/minute without the .dt accessor machinery
+            minutes = data[DATE_TIME].to_numpy().astype("datetime64[m]").view("i8")
+            self._hour_arr = ((minutes // 60) % 24).astype(np.int8)
+            self._minute_arr = (minutes % 60).astype(np.int8)
+            self._lonlat = data[["lon", "lat"]].to_numpy(np.float32)
+
+        # The slider only ever selects one of 24 hours, so split the points and
+        # the per-minute histograms by hour once instead of on every tick.
+        # Sorting by hour makes every hour a contiguous slice (a view, no copy).
+        order = np.argsort(self._hour_arr, kind="stable")
+        hour_sorted = self._hour_arr[order]
+        lonlat_sorted = self._lonlat[order]
+        hour_bounds = np.searchsorted(hour_sorted, np.arange(25))
+        self._points_by_hour = [
+            lonlat_sorted[hour_bounds[h]:hour_bounds[h + 1]] for h in range(24)
+        ]
+        # Single pass over (hour, minute) pairs yields the full 24x60 table;
+        # the chart rows for every hour are built from it up front as well
+        hist_table = np.bincount(
+            self._hour_arr.astype(np.intp) * 60 + self._minute_arr, minlength=24 * 60
+        ).reshape(24, 60)
+        self._hist_by_hour = [
+            [{"minute": minute, "pickups": count} for minute, count in enumerate(row)]
+            for row in hist_table.tolist()
+        ]
+
         # Calculate initial lat/lon for NYC map if data is available
-        initial_nyc_lat = np.average(self._data_cache["lat"]) if not self._data_cache.empty and "lat" in self._data_cache else 40.730610
-        initial_nyc_lon = np.average(self._data_cache["lon"]) if not self._data_cache.empty and "lon" in self._data_cache else -73.935242
+        if len(self._lonlat):
+            initial_nyc_lon, initial_nyc_lat = self._lonlat.mean(axis=0).tolist()
+        else:
+            initial_nyc_lon, initial_nyc_lat = -73.935242, 40.730610
 
         self.map_definitions = [
             {
@@ -118,6 +194,8 @@ class UberPickupsApp(TrameApp):
             },
         ]
 
+        self._map_by_id = {map_def["id"]: map_def for map_def in self.map_definitions}
+
         # Initialize widget references and state for titles
         for map_def in self.map_definitions:
             setattr(self, map_def["widget_name"], None)
@@ -130,11 +208,48 @@ class UberPickupsApp(TrameApp):
             print("WARNING: MAPBOX_API_KEY environment variable not set. Maps may not render correctly.")
             print("Please set it and restart the application. You can get a free key from https://www.mapbox.com/")
 
+        self._records_by_hour = {}
+        self._pending_update = None
+
+        # Build and serialize a single Deck up front; the maps only differ by
+        # their view state, and slider changes only swap the layer data into
+        # the serialized form, skipping pydeck's to_json / json.loads round-trip
+        base_deck_data = deckgl.Deck.to_data(self._create_deck())
+        self._deck_data = {
+            map_def["id"]: {
+                **base_deck_data,
+                "initialViewState": {
+                    **base_deck_data["initialViewState"],
+                    "latitude": map_def["lat"],
+                    "longitude": map_def["lon"],
+                    "zoom": map_def["zoom"],
+                },
+            }
+            for map_def in self.map_definitions
+        }
+
         self._build_ui()
         self.update_data_and_plots() # Initial data processing and plot rendering
         self.state.loading = False
 
     @change("pickupHour")
+    def on_pickup_hour_change(self, pickupHour, **kwargs):
+        # Coalesce rapid slider ticks so a drag only redraws for the final hour
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.update_data_and_plots(pickupHour)
+            return
+
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+        self._pending_update = loop.call_later(SLIDER_DEBOUNCE_SECONDS, self._flush_pickup_hour)
+
+    def _flush_pickup_hour(self):
+        self._pending_update = None
+        with self.state:
+            self.update_data_and_plots()
+
     def update_data_and_plots(self, pickupHour=None, **kwargs):
         self.state.loading = True
         if pickupHour is None:
@@ -145,44 +260,16 @@ class UberPickupsApp(TrameApp):
         current_hour_display = f"{pickupHour:02d}:00 - {pickupHour:02d}:59"
         self.state.chartTitle = f"Pickups per minute for {current_hour_display}"
 
-        # Filter data by hour selected
-        if self._data_cache.empty or DATE_TIME not in self._data_cache.columns:
-            filtered_data_for_hour = pd.DataFrame(columns=['lat', 'lon', DATE_TIME])
-        else:
-            filtered_data_for_hour = self._data_cache[
-                self._data_cache[DATE_TIME].dt.hour == pickupHour
-            ]
+        # Points for the selected hour as records, shared by all four maps
+        filtered_data_for_hour = self._hour_records(pickupHour)
 
         # Update all maps
         for map_def in self.map_definitions:
             deck_widget = getattr(self, map_def["widget_name"])
             if deck_widget:
-                deck_config = pdk.Deck(
-                    map_provider="mapbox",
-                    map_style="mapbox://styles/mapbox/light-v9", # Use a default style
-                    initial_view_state=pdk.ViewState(
-                        latitude=map_def["lat"],
-                        longitude=map_def["lon"],
-                        zoom=map_def["zoom"],
-                        pitch=50,
-                    ),
-                    layers=[
-                        pdk.Layer(
-                            "HexagonLayer",
-                            data=filtered_data_for_hour if not filtered_data_for_hour.empty else pd.DataFrame(columns=['lon', 'lat']),
-                            get_position=["lon", "lat"],
-                            radius=100,
-                            elevation_scale=4,
-                            elevation_range=[0, 1000],
-                            pickable=True,
-                            extruded=True,
-                            auto_highlight=True,
-                        ),
-                    ],
-                    api_keys={"mapbox": self.state.mapboxApiKey} if self.state.mapboxApiKey else None,
-                    tooltip={"html": "<b>Pickups:</b> {elevationValue}", "style": {"color": "white", "backgroundColor": "rgba(0,0,0,0.7)"}}
-                )
-                deck_widget.update(deck_config)
+                deck_data = self._deck_data[map_def["id"]]
+                layer_data = {**deck_data["layers"][0], "data": filtered_data_for_hour}
+                self.state[deck_widget.key] = {**deck_data, "layers": [layer_data]}
                 if map_def["id"] == "nyc":
                     self.state[map_def["title_key"]] = f"{map_def['static_title']} ({current_hour_display})"
                 else:
@@ -190,31 +277,45 @@ class UberPickupsApp(TrameApp):
 
         # Update histogram
         if self._hour_histogram:
-            if not filtered_data_for_hour.empty and DATE_TIME in filtered_data_for_hour.columns:
-                hist_data = np.histogram(
-                    filtered_data_for_hour[DATE_TIME].dt.minute, bins=60, range=(0, 59) # range up to 59 for 60 bins
-                )[0]
-            else:
-                hist_data = np.zeros(60)
-            
-            chart_data = pd.DataFrame({"minute": range(60), "pickups": hist_data})
-
-            altair_chart = (
-                alt.Chart(chart_data)
-                .mark_area(interpolate="step-after", color="#1E88E5", line=True)
-                .encode(
-                    x=alt.X("minute:Q", scale=alt.Scale(nice=False), title="Minute of the Hour"),
-                    y=alt.Y("pickups:Q", title="Number of Pickups"),
-                    tooltip=[
-                        alt.Tooltip("minute:Q", title="Minute"),
-                        alt.Tooltip("pickups:Q", title="Pickups"),
-                    ],
-                )
-                .properties(title=self.state.chartTitle, width="container", height=150)
-            ).configure_axis(grid=False).configure_view(strokeWidth=0).configure_title(fontSize=14, anchor='middle')
-            self._hour_histogram.update(altair_chart)
+            records = self._hist_by_hour[pickupHour]
+
+            spec = {**HIST_SPEC, "data": {"values": records}, "title": self.state.chartTitle}
+            self.state[self._hour_histogram.key] = spec
         self.state.loading = False
 
+    def _hour_records(self, hour):
+        records = self._records_by_hour.get(hour)
+        if records is None:
+            # Plain [lon, lat] pairs (read with get_position="-") instead of
+            # {"lon": ..., "lat": ...} objects: no per-point keys on the wire
+            records = self._points_by_hour[hour].tolist()
+            self._records_by_hour[hour] = records
+        return records
+
+    def _create_deck(self):
+        import pydeck as pdk  # Only needed once, to build the Deck template
+
+        return pdk.Deck(
+            map_provider="mapbox",
+            map_style="mapbox://styles/mapbox/light-v9", # Use a default style
+            initial_view_state=pdk.ViewState(pitch=50),
+            layers=[
+                pdk.Layer(
+                    "HexagonLayer",
+                    data=[],
+                    get_position="-",
+                    radius=100,
+                    elevation_scale=4,
+                    elevation_range=[0, 1000],
+                    pickable=True,
+                    extruded=True,
+                    auto_highlight=True,
+                ),
+            ],
+            api_keys={"mapbox": self.state.mapboxApiKey} if self.state.mapboxApiKey else None,
+            tooltip={"html": "<b>Pickups:</b> {elevationValue}", "style": {"color": "white", "backgroundColor": "rgba(0,0,0,0.7)"}}
+        )
+
     def _build_ui(self):
         # Simplified card properties - remove complex flex styling for now
         card_props = {"elevation": 2, "rounded": "lg", "class_": "ma-1"} 
@@ -222,7 +323,7 @@ class UberPickupsApp(TrameApp):
         
         NYC_map_deck_style = "width: 100%; height: 100%; min-height: 40vh; border-radius: inherit;"
         map_deck_style = "width: 100%; height: 100%; min-height: 10.0vh; border-radius: inherit;"
-        # Altair chart height is 200px, set in update_data_and_plots
+        # Histogram height is 150px, set in HIST_SPEC
 
         with SinglePageLayout(self.server, full_height=True) as self.ui:
             self.ui.title.set_text("NYC Uber Pickups Explorer")
@@ -244,7 +345,7 @@ class UberPickupsApp(TrameApp):
                             # ROW 1.2.1: JFK Map
                             with vuetify3.VRow(no_gutters=True, classes="flex-shrink-0"):
                                 with vuetify3.VCol(cols=12, classes="pa-1"):
-                                    map_jfk_def = next(m for m in self.map_definitions if m["id"] == "jfk")
+                                    map_jfk_def = self._map_by_id["jfk"]
                                     with vuetify3.VCard():
                                         vuetify3.VCardTitle(f"{{{{ {map_jfk_def['title_key']} }}}}", classes="py-1 text-caption")
                                         with vuetify3.VCardText():
@@ -255,7 +356,7 @@ class UberPickupsApp(TrameApp):
                             # ROW 1.2.2: Newark Map
                             with vuetify3.VRow(no_gutters=True, classes="flex-shrink-0"):
                                 with vuetify3.VCol(cols=12, classes="pa-1"):
-                                    map_nwk_def = next(m for m in self.map_definitions if m["id"] == "nwk")
+                                    map_nwk_def = self._map_by_id["nwk"]
                                     with vuetify3.VCard():
                                         vuetify3.VCardTitle(f"{{{{ {map_nwk_def['title_key']} }}}}", classes="py-1 text-caption")
                                         with vuetify3.VCardText():
@@ -266,7 +367,7 @@ class UberPickupsApp(TrameApp):
                             # ROW 1.2.3: LaGuardia Map
                             with vuetify3.VRow(no_gutters=True, classes="flex-shrink-0"):
                                 with vuetify3.VCol(cols=12,classes="pa-1"):
-                                    map_lga_def = next(m for m in self.map_definitions if m["id"] == "lga")
+                                    map_lga_def = self._map_by_id["lga"]
                                     with vuetify3.VCard():
                                         vuetify3.VCardTitle(f"{{{{ {map_lga_def['title_key']} }}}}", classes="py-1 text-caption")
                                         with vuetify3.VCardText():
@@ -276,7 +377,7 @@ class UberPickupsApp(TrameApp):
                                         ))
                         # COL 1.1: NYC Map
                         with vuetify3.VCol(cols=6, classes="pa-1"):
-                            map_nyc_def = next(m for m in self.map_definitions if m["id"] == "nyc")
+                            map_nyc_def = self._map_by_id["nyc"]
                             with vuetify3.VCard():
                                 vuetify3.VCardTitle(f"{{{{ {map_nyc_def['title_key']} }}}}", classes="py-2 text-subtitle-1")
                                 with vuetify3.VCardText():
@@ -287,7 +388,7 @@ class UberPickupsApp(TrameApp):
                 # New html.Div for Histogram and Slider, directly under self.ui.content (sibling to VContainer above)
                 with html.Div(classes="pa-2"):
                     # Histogram
-                    self._hour_histogram = vega.Figure(style="width: 100%; height: 150px;") # Altair chart height is 150px, width is container
+                    self._hour_histogram = vega.Figure(style="width: 100%; height: 150px;") # Chart height is 150px, width is container
                     
                     # Spacer - simple div for margin, or use Vuetify spacer if preferred in this context
                     html.Div(style="height: 16px;")
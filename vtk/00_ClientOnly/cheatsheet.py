@@ -16,7 +16,7 @@
 # - Client-side rendering using `vtk.VtkView`, `VtkGeometryRepresentation`, and `VtkAlgorithm`.
 # - Reactive state variable `resolution` controlling the cone's detail.
 # - `VSlider` for user interaction to change the resolution.
-# - `@change` decorator to react to state changes (`resolution`).
+# - Client-side `state` binding, so slider changes need no server callback.
 # - Standard Trame app structure with `TrameApp` subclass.
 #
 # Running if uv is available:
@@ -46,7 +46,6 @@
 from trame.app import TrameApp
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vuetify3 as v3, vtk
-from trame.decorators import change
 
 
 class ConeApp(TrameApp):
@@ -59,12 +58,6 @@ class ConeApp(TrameApp):
         """Initialize reactive state variables."""
         self.state.resolution = 6
 
-    @change("resolution")
-    def _on_resolution_change(self, resolution, **kwargs):
-        """Called when the 'resolution' state variable changes."""
-        # For client-only rendering, the change to `state.resolution`
-        # is automatically picked up by the VtkAlgorithm's `state` binding.
-
     def reset_resolution(self):
         """Resets the resolution to its default value."""
         self.state.resolution = 6
@@ -60,7 +60,6 @@ from trame.app import TrameApp
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vtk as vtk_widgets
 from trame.widgets import vuetify3 as v
-from trame.decorators import change
 
 
 class ClientConeApp(TrameApp):
@@ -79,12 +78,6 @@ class ClientConeApp(TrameApp):
         self.state.trame__title = "VTK Client-Side Rendering"
         self.state.theme_mode = "light"
 
-    @change("resolution")
-    def _on_resolution_change(self, resolution, **kwargs):
-        """Called when the 'resolution' state variable changes."""
-        # For client-only rendering, the change to `state.resolution`
-        # is automatically picked up by the VtkAlgorithm's `state` binding.
-
     def _build_ui(self):
         """Build the user interface."""
         with SinglePageLayout(self.server, full_height=True, theme=("theme_mode", "light")) as self.ui:
@@ -46,6 +46,8 @@
 #   python ./01_SimpleCone/ClientView.py --server
 # ---
 
+import asyncio
+
 from vtkmodules.vtkFiltersSources import vtkConeSource
 
 from trame.app import TrameApp
@@ -55,6 +57,7 @@ from trame.widgets import vtk
 from trame.widgets import vuetify3 as v3
 
 DEFAULT_RESOLUTION = 6
+RESOLUTION_UPDATE_INTERVAL = 1 / 60 # seconds, about one frame
 
 # -----------------------------------------------------------------------------
 # Application
@@ -63,7 +66,9 @@ DEFAULT_RESOLUTION = 6
 class ClientViewApp(TrameApp):
     def __init__(self, server=None):
         super().__init__(server=server, client_type="vue3")
-        self.cone_source = vtkConeSource()
+        self._cone_meshes = {} # resolution -> vtkPolyData
+        self._resolution_handle = None
+        self._last_resolution = -1
         self._initialize_state()
         self._build_ui()
         self._on_resolution_change(resolution=self.state.resolution) # Initial cone update
@@ -76,9 +81,40 @@ class ClientViewApp(TrameApp):
     @change("resolution")
     def _on_resolution_change(self, resolution, **kwargs):
         """Called when the 'resolution' state variable changes."""
-        self.cone_source.SetResolution(int(resolution))
-        if hasattr(self.ctrl, "mesh_update"):
-            self.ctrl.mesh_update()
+        # Dragging the slider emits one change per step; apply at most one
+        # update per frame using the latest value
+        if self._resolution_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_cone()
+            return
+        self._resolution_handle = loop.call_later(RESOLUTION_UPDATE_INTERVAL, self._flush_resolution)
+
+    def _flush_resolution(self):
+        self._resolution_handle = None
+        with self.state:
+            self._update_cone()
+
+    def _update_cone(self):
+        resolution = int(self.state.resolution)
+        if resolution == self._last_resolution:
+            return # e.g. the slider was dragged back to where it started
+        self._last_resolution = resolution
+        if hasattr(self.ctrl, "mesh_set_dataset"):
+            self.ctrl.mesh_set_dataset(self._cone_mesh(resolution))
+
+    def _cone_mesh(self, resolution):
+        # Each resolution's cone is generated once; dragging back over a value
+        # just swaps the dataset pushed to the client
+        mesh = self._cone_meshes.get(resolution)
+        if mesh is None:
+            cone_source = vtkConeSource()
+            cone_source.SetResolution(resolution)
+            cone_source.Update()
+            mesh = self._cone_meshes[resolution] = cone_source.GetOutput()
+        return mesh
 
     def reset_resolution(self):
         """Resets the resolution to its default value."""
@@ -112,9 +148,9 @@ class ClientViewApp(TrameApp):
                         self.ctrl.view_reset_camera = view.reset_camera
                         with vtk.VtkGeometryRepresentation():
                             vtk_polydata = vtk.VtkPolyData(
-                                "cone", dataset=self.cone_source
+                                "cone", dataset=self._cone_mesh(self.state.resolution)
                             )
-                            self.ctrl.mesh_update = vtk_polydata.update
+                            self.ctrl.mesh_set_dataset = vtk_polydata.set_dataset
             return self.ui
 
 # -----------------------------------------------------------------------------
@@ -48,8 +48,9 @@
 #   python ./vtk/01_SimpleCone/LocalRendering.py --server
 # ---
 
+import asyncio
+
 from vtkmodules.vtkFiltersSources import vtkConeSource
-from vtkmodules.vtkInteractionStyle import vtkInteractorStyleSwitch
 from vtkmodules.vtkRenderingCore import (
     vtkActor,
     vtkPolyDataMapper,
@@ -64,6 +65,7 @@ from trame.widgets import vtk as vtk_widgets
 from trame.widgets import vuetify3 as v3
 
 DEFAULT_RESOLUTION = 6
+RESOLUTION_UPDATE_INTERVAL = 1 / 60 # seconds, about one frame
 
 # -----------------------------------------------------------------------------
 # Application
@@ -74,28 +76,22 @@ class LocalRenderingApp(TrameApp):
         super().__init__(server=server, client_type="vue3")
 
         # VTK pipeline setup
-        self.cone_source = vtkConeSource()
+        self._cone_meshes = {} # resolution -> vtkPolyData
+        self._resolution_handle = None
+        self._last_resolution = -1
         self.mapper = vtkPolyDataMapper()
         self.actor = vtkActor()
         self.renderer = vtkRenderer()
         self.render_window = vtkRenderWindow()
 
-        self.mapper.SetInputConnection(self.cone_source.GetOutputPort())
+        self.mapper.SetInputData(self._cone_mesh(DEFAULT_RESOLUTION))
         self.actor.SetMapper(self.mapper)
         self.renderer.AddActor(self.actor)
         self.render_window.AddRenderer(self.renderer)
 
-        # Set interactor style for the render window
-        # VtkLocalView will use the interactor from this render_window
-        style = vtkInteractorStyleSwitch()
-        style.SetCurrentStyleToTrackballCamera()
-        # VtkLocalView manages its own interactor, so we don't set one on the render_window directly.
-        # However, we can configure the style it *would* use if it had one, or rely on VtkLocalView's defaults.
-        # For this example, ensuring TrackballCamera is preferred.
-        # self.render_window.GetInteractor().SetInteractorStyle(style) # This line might be optional or handled by VtkLocalView
-
+        # VtkLocalView renders in the browser with its own interactor, so the
+        # server window is never rendered (which would create a GL context)
         self.renderer.ResetCamera()
-        self.render_window.Render()  # Initial render
 
         # Initialize Trame state and UI
         self._initialize_state()
@@ -111,10 +107,43 @@ class LocalRenderingApp(TrameApp):
     @change("resolution")
     def _on_resolution_change(self, resolution, **kwargs):
         """Called when the 'resolution' state variable changes."""
-        self.cone_source.SetResolution(int(resolution))
+        # Dragging the slider emits one change per step; apply at most one
+        # update per frame using the latest value
+        if self._resolution_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_cone()
+            return
+        self._resolution_handle = loop.call_later(RESOLUTION_UPDATE_INTERVAL, self._flush_resolution)
+
+    def _flush_resolution(self):
+        self._resolution_handle = None
+        with self.state:
+            self._update_cone()
+
+    def _update_cone(self):
+        resolution = int(self.state.resolution)
+        if resolution == self._last_resolution:
+            return # e.g. the slider was dragged back to where it started
+        self._last_resolution = resolution
+        self.mapper.SetInputData(self._cone_mesh(resolution))
         if hasattr(self.ctrl, "view_update"):
             self.ctrl.view_update() # This will call VtkLocalView.update()
 
+    def _cone_mesh(self, resolution):
+        # Each resolution's cone is generated once. Swapping the mapper input
+        # to an unmodified polydata also lets the scene serializer reuse the
+        # arrays it already sent for that resolution.
+        mesh = self._cone_meshes.get(resolution)
+        if mesh is None:
+            cone_source = vtkConeSource()
+            cone_source.SetResolution(resolution)
+            cone_source.Update()
+            mesh = self._cone_meshes[resolution] = cone_source.GetOutput()
+        return mesh
+
     def reset_resolution(self):
         """Resets the resolution to its default value."""
         self.state.resolution = DEFAULT_RESOLUTION
@@ -80,14 +80,13 @@ from trame.widgets import vuetify3, vtk as vtk_widgets
 # -----------------------------------------------------------------------------
 # VTK View event types for custom/advanced event handling
 # -----------------------------------------------------------------------------
-VTK_VIEW_EVENTS = [
+# Events fired once per user action
+DISCRETE_VIEW_EVENTS = (
     "StartAnimation",
-    "Animation",
     "EndAnimation",
     "MouseEnter",
     "MouseLeave",
     "StartMouseMove",
-    "MouseMove",
     "EndMouseMove",
     "LeftButtonPress",
     "LeftButtonRelease",
@@ -99,25 +98,32 @@ VTK_VIEW_EVENTS = [
     "KeyDown",
     "KeyUp",
     "StartMouseWheel",
-    "MouseWheel",
     "EndMouseWheel",
     "StartPinch",
-    "Pinch",
     "EndPinch",
     "StartPan",
-    "Pan",
     "EndPan",
     "StartRotate",
-    "Rotate",
     "EndRotate",
     "Button3D",
-    "Move3D",
     "StartPointerLock",
     "EndPointerLock",
     "StartInteraction",
-    "Interaction",
     "EndInteraction",
-]
+)
+# Events fired on every frame or pointer move while interacting; each one is
+# a message to the server, so only listen to them when really needed
+HIGH_FREQUENCY_VIEW_EVENTS = (
+    "Animation",
+    "MouseMove",
+    "MouseWheel",
+    "Pinch",
+    "Pan",
+    "Rotate",
+    "Move3D",
+    "Interaction",
+)
+VTK_VIEW_EVENTS = DISCRETE_VIEW_EVENTS + HIGH_FREQUENCY_VIEW_EVENTS
 
 
 class RemoteRenderingApp(TrameApp):
@@ -218,12 +224,11 @@ class RemoteRenderingApp(TrameApp):
     # 
     # def _event_listeners(self, events):
     #     """Helper function to create event listeners for VTK view."""
-    #     result = {}
-    #     for event_name in events:
-    #         # The string "[utils.vtk.event($event)]" will be evaluated on the client.
-    #         # It assumes a 'utils.vtk.event' function is available in the client scope.
-    #         result[event_name] = (self.on_event, "[utils.vtk.event($event)]") # User suggestion
-    #     return result
+    #     # The string "[utils.vtk.event($event)]" will be evaluated on the client.
+    #     # It assumes a 'utils.vtk.event' function is available in the client scope.
+    #     # All events share one (callback, args) pair.
+    #     listener = (self.on_event, "[utils.vtk.event($event)]")
+    #     return dict.fromkeys(events, listener)
 
     def _build_ui(self):
         """Build the user interface."""
@@ -255,11 +260,12 @@ class RemoteRenderingApp(TrameApp):
                     # from the client to the server-side Python callback.
                     # The `interactor_events` prop specifies which events to listen for,
                     # and `**self._event_listeners` maps them to the `on_event` method,
-                    # which receives the full event payload.
+                    # which receives the full event payload. Only the discrete events
+                    # are listed; use VTK_VIEW_EVENTS to also receive the per-frame ones.
                     view = vtk_widgets.VtkRemoteView(
                         self.render_window,
-                        # interactor_events=("event_types", VTK_VIEW_EVENTS),
-                        # **self._event_listeners(VTK_VIEW_EVENTS),
+                        # interactor_events=("event_types", DISCRETE_VIEW_EVENTS),
+                        # **self._event_listeners(DISCRETE_VIEW_EVENTS),
                     )
                     self.ctrl.view_update = view.update
 
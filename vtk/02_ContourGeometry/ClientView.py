@@ -15,9 +15,10 @@
 # geometry update in real-time. The rendering is performed on the client side.
 #
 # **Key Features:**
-# - Server-side VTK pipeline with a `vtkContourFilter`.
+# - Server-side VTK pipeline contouring with `vtkFlyingEdges3D`.
 # - Client-side rendering using `VtkLocalView`.
-# - Interactive contour value adjustment with a slider.
+# - Interactive contour value adjustment with a slider, or on-release updates
+#   when "Interactive" is unchecked.
 # - Dynamic updates of the geometry.
 
 # ---
@@ -42,6 +43,9 @@
 #
 # ---
 
+import asyncio
+import functools
+import os
 import vtk
 from pathlib import Path
 
@@ -50,35 +54,33 @@ from trame.decorators import change
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vuetify3 as vuetify, vtk as vtk_widgets
 
+CONTOUR_UPDATE_INTERVAL = 1 / 60 # seconds; at most one contour update per display frame while dragging
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+
+vtk.vtkSMPTools.SetBackend(os.environ.get("VTK_SMP_BACKEND_IN_USE", "STDThread"))
+
 # -----------------------------------------------------------------------------
 # VTK pipeline
 # -----------------------------------------------------------------------------
 
-def create_pipeline():
-    """Create and return a VTK pipeline."""
-    data_directory = Path(__file__).parent.parent.with_name("data")
-    head_vti = data_directory / "head.vti"
-
+@functools.lru_cache(maxsize=None)
+def load_image(path):
+    """Read a .vti file once per process; apps only read from the image."""
     reader = vtk.vtkXMLImageDataReader()
-    reader.SetFileName(str(head_vti))
+    reader.SetFileName(str(path))
     reader.Update()
+    return reader.GetOutput()
+
 
-    contour = vtk.vtkContourFilter()
-    contour.SetInputConnection(reader.GetOutputPort())
+def create_pipeline():
+    """Create and return a VTK pipeline. Its input is set once the data is loaded."""
+    contour = vtk.vtkFlyingEdges3D()
     contour.SetComputeNormals(1)
     contour.SetComputeScalars(0)
-
-    data_range = reader.GetOutput().GetPointData().GetScalars().GetRange()
-    contour_value = 0.5 * (data_range[0] + data_range[1])
-
     contour.SetNumberOfContours(1)
-    contour.SetValue(0, contour_value)
 
     return {
-        "reader": reader,
         "contour": contour,
-        "data_range": data_range,
-        "contour_value": contour_value,
     }
 
 
@@ -93,8 +95,9 @@ class ContourApp(TrameApp):
 
         # VTK pipeline setup
         pipeline = create_pipeline()
-        self.reader = pipeline["reader"]
         self.contour_filter = pipeline["contour"] # Renamed for clarity
+        self._contour_handle = None
+        self._last_contour = None # (value, has normals) the view currently shows
 
         # VTK rendering setup for VtkLocalView
         self.renderer = vtk.vtkRenderer()
@@ -106,35 +109,90 @@ class ContourApp(TrameApp):
         self.actor = vtk.vtkActor()
         self.mapper.SetInputConnection(self.contour_filter.GetOutputPort())
         self.actor.SetMapper(self.mapper)
-        self.renderer.AddActor(self.actor)
-        self.renderer.ResetCamera()
+        # The local view's serializer brings the pipeline up to date itself,
+        # so renders don't need to re-check it
+        self.mapper.StaticOn()
 
         # Initialize state
-        self._initialize_state(pipeline["data_range"], pipeline["contour_value"])
+        self._initialize_state()
 
         # Build UI
         self.ui = self._build_ui()
 
-        # Initial update
-        self._on_contour_change()
+        # Read the data once the server is up, so creating the app (e.g. in
+        # Jupyter) doesn't wait on disk I/O
+        self.ctrl.on_server_ready.add_task(self._load_data)
 
-    def _initialize_state(self, data_range, contour_value):
+    def _initialize_state(self):
         """Initialize the application's state."""
         self.state.trame__title = "VTK Contour - Client Rendering"
-        self.state.data_range = data_range
-        self.state.contour_value = contour_value
+        self.state.data_loading = True
+        self.state.data_range = (0, 1) # Replaced by the data's range once loaded
+        self.state.contour_value = None
+        self.state.interactive_update = True # Recompute while dragging
+
+    async def _load_data(self, **kwargs):
+        """Read head.vti and compute the first contour off the event loop."""
+        # The actor is only added to the renderer afterwards, so the view
+        # never touches the pipeline while the worker threads use it
+        image = await asyncio.to_thread(load_image, DATA_DIR / "head.vti")
+        data_range = image.GetPointData().GetScalars().GetRange()
+        contour_value = 0.5 * (data_range[0] + data_range[1])
+        self.contour_filter.SetInputData(image)
+        self.contour_filter.SetValue(0, contour_value)
+        await asyncio.to_thread(self.contour_filter.Update)
+
+        self.renderer.AddActor(self.actor)
+        self.renderer.ResetCamera()
+        with self.state:
+            self.state.data_range = data_range
+            self.state.contour_value = contour_value
+            self.state.data_loading = False
+            self._update_contour()
 
     @change("contour_value")
     def _on_contour_change(self, **kwargs):
         """Update the contour filter when the contour_value state changes."""
-        if self.state.contour_value is None:
+        if not self.state.interactive_update:
+            return # Applied once on slider release by commit_changes
+
+        # Slider drags emit a change per mouse move; recompute at most once
+        # per interval, always with the latest value
+        if self._contour_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_contour()
+            return
+        self._contour_handle = loop.call_later(CONTOUR_UPDATE_INTERVAL, self._flush_contour)
+
+    def commit_changes(self, value):
+        """Called on the VSlider 'end' event to apply the final, shaded contour."""
+        self.state.contour_value = value
+        self._update_contour()
+
+    def _flush_contour(self):
+        self._contour_handle = None
+        with self.state:
+            # Skip normals while dragging; commit_changes adds them on release
+            self._update_contour(compute_normals=False)
+
+    def _update_contour(self, compute_normals=True):
+        if self.state.data_loading or self.state.contour_value is None:
             return
 
-        self.contour_filter.SetValue(0, self.state.contour_value)
-        # self.ctrl.contour_update() # VtkPolyData widget not used directly with VtkLocalView like this
-        self.mapper.Update()
-        if self.render_window.GetInteractor() and self.render_window.GetInteractor().GetInitialized():
-            self.render_window.Render()
+        contour_value = float(self.state.contour_value)
+        if self._last_contour is not None:
+            last_value, last_normals = self._last_contour
+            if contour_value == last_value and (last_normals or not compute_normals):
+                return # e.g. the slider was released where the last update left it
+
+        self.contour_filter.SetValue(0, contour_value)
+        self.contour_filter.SetComputeNormals(compute_normals)
+        self._last_contour = (contour_value, compute_normals)
+        # VtkLocalView's serializer updates the contour filter when it
+        # serializes the mapper, so there is no separate Update() or Render()
         self.ctrl.view_update() # Signal VtkLocalView to update
 
     def _build_ui(self):
@@ -144,10 +202,21 @@ class ContourApp(TrameApp):
 
             with layout.toolbar:
                 vuetify.VSpacer()
+                vuetify.VCheckbox(
+                    v_model=("interactive_update", self.state.interactive_update),
+                    label="Interactive",
+                    density="compact",
+                    hide_details=True,
+                    classes="mt-0 pt-0 ml-2 mr-2",
+                )
                 vuetify.VSlider(
                     v_model=("contour_value", self.state.contour_value),
+                    __events=["end"],
+                    end=(self.commit_changes, "[$event]"),
                     min=("data_range[0]", self.state.data_range[0]),
                     max=("data_range[1]", self.state.data_range[1]),
+                    step=("(data_range[1] - data_range[0]) / 100",), # Fewer value changes per drag
+                    disabled=("data_loading",),
                     hide_details=True,
                     dense=True,
                     style="max-width: 300px",
@@ -165,7 +234,7 @@ class ContourApp(TrameApp):
                     indeterminate=True,
                     absolute=True,
                     bottom=True,
-                    active=("trame__busy",),
+                    active=("trame__busy || data_loading",),
                 )
 
             with layout.content:
@@ -112,25 +112,44 @@
 #
 # ---
 
+import asyncio
+import functools
+import os
 from pathlib import Path
 
 import vtkmodules.vtkRenderingOpenGL2  # noqa
-from vtkmodules.vtkFiltersCore import vtkContourFilter
+from vtkmodules.vtkCommonCore import vtkSMPTools
+from vtkmodules.vtkFiltersCore import vtkFlyingEdges3D
 from vtkmodules.vtkIOXML import vtkXMLImageDataReader
 from vtkmodules.vtkRenderingCore import (
     vtkActor,
     vtkPolyDataMapper,
     vtkRenderer,
     vtkRenderWindow,
-    vtkRenderWindowInteractor,
 )
-from vtkmodules.vtkInteractionStyle import vtkInteractorStyleSwitch
+from vtkmodules.vtkRenderingUI import vtkGenericRenderWindowInteractor
+from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
 
 from trame.app import TrameApp, get_server
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vuetify3, vtk
 from trame.decorators import change
 
+DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+CONTOUR_UPDATE_INTERVAL = 1 / 60 # seconds; at most one contour update per display frame while dragging
+
+vtkSMPTools.SetBackend(os.environ.get("VTK_SMP_BACKEND_IN_USE", "STDThread"))
+
+
+@functools.lru_cache(maxsize=None)
+def load_image(path):
+    """Reads a .vti file once per process; apps only read from the image."""
+    reader = vtkXMLImageDataReader()
+    reader.SetFileName(str(path))
+    reader.Update()
+    return reader.GetOutput()
+
+
 # -----------------------------------------------------------------------------
 # Main Application Class
 # -----------------------------------------------------------------------------
@@ -145,53 +164,70 @@ class ContourViewApp(TrameApp):
 
         # VTK pipeline setup
         self._setup_vtk_pipeline()
+        self._last_contour = None # (value, has normals) the views currently show
+        self._contour_handle = None
 
         # Initialize state and UI
         self._initialize_state()
         self.default_contour_value = 50.0
         self._build_ui()
 
-        # Set initial contour value and update views
-        self._update_contour_and_render()
+        # Contour updates bring the pipeline up to date themselves, so renders
+        # don't need to re-check it
+        self.mapper.StaticOn()
 
-    def _setup_vtk_pipeline(self):
-        """Creates and configures the VTK pipeline."""
-        data_path = Path(__file__).parent.parent.parent / "data" / "head.vti"
-        self.reader = vtkXMLImageDataReader()
-        self.reader.SetFileName(data_path)
-        self.reader.Update()
+        # Read the data once the server is up, so creating the app (e.g. in
+        # Jupyter) doesn't wait on disk I/O
+        self.ctrl.on_server_ready.add_task(self._load_data)
 
-        self.contour = vtkContourFilter()
-        self.contour.SetInputConnection(self.reader.GetOutputPort())
-        self.contour.SetComputeNormals(1)
+    def _setup_vtk_pipeline(self):
+        """Creates and configures the VTK pipeline. Its input is set by _load_data."""
+        self.contour = vtkFlyingEdges3D()
 
         self.mapper = vtkPolyDataMapper()
         self.mapper.SetInputConnection(self.contour.GetOutputPort())
-        self.mapper.SetScalarRange(self.reader.GetOutput().GetScalarRange())
 
         self.actor = vtkActor()
         self.actor.SetMapper(self.mapper)
 
-        self.renderer = vtkRenderer()
-        self.renderer.AddActor(self.actor)
-        self.renderer.ResetCamera()
+        self.renderer = vtkRenderer() # The actor is added once the data is loaded
 
         self.render_window = vtkRenderWindow()
         self.render_window.AddRenderer(self.renderer)
         self.render_window.SetOffScreenRendering(1)  # Essential for VtkRemoteView
-        self.render_window_interactor = vtkRenderWindowInteractor()
+        self.render_window.SetMultiSamples(0)  # No MSAA resolve on every remote frame
+        self.render_window.SetAlphaBitPlanes(0)  # Remote frames are captured as RGB
+        # VtkRemoteView replays the client's mouse events on an interactor; a
+        # generic one does that without any platform window system (X11 etc.)
+        self.render_window_interactor = vtkGenericRenderWindowInteractor()
         self.render_window_interactor.SetRenderWindow(self.render_window)
-        # Set current style to TrackballCamera, assuming default interactor style is vtkInteractorStyleSwitch
-        self.render_window_interactor.GetInteractorStyle().SetCurrentStyleToTrackballCamera()
-        
+        self.render_window_interactor.SetInteractorStyle(vtkInteractorStyleTrackballCamera())
 
     def _initialize_state(self):
         """Initializes the application's reactive state."""
         self.state.trame__title = "VTK Local/Remote Contour"
+        self.state.data_loading = True
         self.state.contour_value = 50.0
         self.state.view_mode = "Remote"  # Start with Remote view
         self.state.interactive_update = True # Default to interactive updates
 
+    async def _load_data(self, **kwargs):
+        """Reads head.vti and computes the first contour off the event loop."""
+        # The actor is only added to the renderer afterwards, so the views
+        # never touch the pipeline while the worker threads use it
+        image = await asyncio.to_thread(load_image, DATA_DIR / "head.vti")
+        self._scalar_range = image.GetScalarRange() # Static for this file
+        self.mapper.SetScalarRange(self._scalar_range)
+        self.contour.SetInputData(image)
+        self.contour.SetValue(0, float(self.state.contour_value))
+        await asyncio.to_thread(self.contour.Update)
+
+        self.renderer.AddActor(self.actor)
+        self.renderer.ResetCamera()
+        with self.state:
+            self.state.data_loading = False
+            self._update_contour_and_render()
+
     def _toggle_view_mode(self):
         if self.state.view_mode == "Local":
             self.state.view_mode = "Remote"
@@ -201,6 +237,10 @@ class ContourViewApp(TrameApp):
     @change("view_mode")
     def _sync_view_on_mode_change(self, view_mode, **kwargs):
         """Ensures the newly activated view is updated when the mode changes."""
+        # Both views stay mounted but the hidden one misses contour changes and
+        # camera moves, so always push the shown view. The local view's
+        # serializer skips arrays the client already has, so an unchanged
+        # contour is not sent again
         if view_mode == "Remote":
             if hasattr(self.ctrl, 'remote_view_update') and self.ctrl.remote_view_update:
                 self.ctrl.remote_view_update()
@@ -209,35 +249,62 @@ class ContourViewApp(TrameApp):
                 self.ctrl.local_view_update()
 
 
-    def _update_contour_and_render(self, new_value=None):
+    def _update_contour_and_render(self, new_value=None, compute_normals=True):
         """Updates the contour filter with the new value and triggers a render."""
-        if new_value is not None:
-            self.state.contour_value = new_value
-
-        self.contour.SetValue(0, float(self.state.contour_value))
-        self.contour.Update()
-        self.render_window.Render()
-
-        if self.state.view_mode == "Remote":
-            if hasattr(self.ctrl, 'remote_view_update') and self.ctrl.remote_view_update:
-                self.ctrl.remote_view_update()
-        elif self.state.view_mode == "Local":
-            if hasattr(self.ctrl, 'local_view_update') and self.ctrl.local_view_update:
-                self.ctrl.local_view_update()
+        if self.state.data_loading:
+            return
+        # Batch the state changes and view update into one client message
+        with self.state:
+            if new_value is not None:
+                self.state.contour_value = new_value
+
+            # Setting contour_value above echoes back through the change handler,
+            # and resets may re-apply the current value: skip those recomputes
+            # unless they only add the normals a drag update left out
+            contour_value = float(self.state.contour_value)
+            if self._last_contour is not None:
+                last_value, last_normals = self._last_contour
+                if contour_value == last_value and (last_normals or not compute_normals):
+                    return
+
+            self.contour.SetValue(0, contour_value)
+            self.contour.SetComputeNormals(compute_normals)
+            self.contour.Update()
+            self._last_contour = (contour_value, compute_normals)
+
+            # Push the new geometry to the visible view only. No Render() here:
+            # the remote view renders when it pushes its image, and the local
+            # view renders on the client
+            self._sync_view_on_mode_change(self.state.view_mode)
 
     @change("contour_value")
     def _on_contour_value_change_interactive(self, contour_value, **kwargs):
         """Called when 'contour_value' state changes, for interactive updates."""
-        if self.state.interactive_update:
-            self._update_contour_and_render(contour_value)
+        if not self.state.interactive_update:
+            return
+
+        # Slider drags emit a change per mouse move; update the views at most
+        # once per frame, always with the latest value
+        if self._contour_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_contour_and_render(compute_normals=False)
+            return
+        self._contour_handle = loop.call_later(CONTOUR_UPDATE_INTERVAL, self._flush_contour)
+
+    def _flush_contour(self):
+        self._contour_handle = None
+        # Normals are skipped while dragging and computed on release
+        self._update_contour_and_render(compute_normals=False)
 
     def commit_changes(self, value):
         """
-        Called on VSlider 'end' event. This is used for non-interactive updates
-        to ensure the final value is applied when the user releases the slider.
+        Called on VSlider 'end' event. This applies the final value when the
+        user releases the slider, with normals for smooth shading.
         """
-        if not self.state.interactive_update:
-            self._update_contour_and_render(value)
+        self._update_contour_and_render(value)
 
     def reset_contour_and_camera(self):
         """Resets the contour value to default and resets the active view's camera."""
@@ -262,7 +329,7 @@ class ContourViewApp(TrameApp):
                     indeterminate=True,
                     absolute=True,
                     bottom=True,
-                    active=("trame__busy",),
+                    active=("trame__busy || data_loading",),
                     color="primary",
                 )
                 vuetify3.VSpacer()
@@ -277,6 +344,8 @@ class ContourViewApp(TrameApp):
                     v_model=("contour_value", 50.0),
                     min=50,
                     max=200,
+                    step=1,
+                    disabled=("data_loading",),
                     density="compact",
                     hide_details=True,
                     __events=['end'],
@@ -301,10 +370,14 @@ class ContourViewApp(TrameApp):
 
             with layout.content:
                 with vuetify3.VContainer(fluid=True, classes="pa-0 fill-height"):
+                    # Both views stay mounted (v_show) so switching modes
+                    # keeps the client's geometry and render context alive
                     # Remote View (Server-side rendering)
                     with vtk.VtkRemoteView(
                         view=self.render_window,
-                        v_if="view_mode === 'Remote'",
+                        v_show="view_mode === 'Remote'",
+                        interactive_quality=50, # Smaller JPEG frames while rotating
+                        still_quality=95,
                     ) as remote_view_instance:
                         self.ctrl.remote_view_update = remote_view_instance.update
                         self.ctrl.remote_view_reset_camera = remote_view_instance.reset_camera
@@ -312,7 +385,7 @@ class ContourViewApp(TrameApp):
                     # Local View (Client-side rendering)
                     with vtk.VtkLocalView(
                         view=self.render_window,
-                        v_if="view_mode === 'Local'",
+                        v_show="view_mode === 'Local'",
                     ) as local_view_instance:
                         self.ctrl.local_view_update = local_view_instance.update
                         self.ctrl.local_view_reset_camera = local_view_instance.reset_camera
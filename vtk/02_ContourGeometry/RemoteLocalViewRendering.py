@@ -57,10 +57,12 @@
 #
 # --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- --- ---
 
+import os
 from pathlib import Path
 
 import vtkmodules.vtkRenderingOpenGL2  # noqa
-from vtkmodules.vtkFiltersCore import vtkContourFilter
+from vtkmodules.vtkCommonCore import vtkSMPTools
+from vtkmodules.vtkFiltersCore import vtkFlyingEdges3D
 from vtkmodules.vtkIOXML import vtkXMLImageDataReader
 from vtkmodules.vtkInteractionStyle import vtkInteractorStyleSwitch  # noqa
 from vtkmodules.vtkRenderingCore import (
@@ -78,6 +80,12 @@ from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vtk as vtk_widgets
 from trame.widgets import vuetify3
 
+vtkSMPTools.SetBackend(os.environ.get("VTK_SMP_BACKEND_IN_USE", "STDThread"))
+
+# Isovalue changes smaller than this fraction of the data range don't visibly
+# move the surface, so they don't recompute the contour
+CONTOUR_VALUE_TOLERANCE = 1 / 500
+
 # -----------------------------------------------------------------------------
 # Application
 # -----------------------------------------------------------------------------
@@ -87,6 +95,8 @@ class ContourApp(TrameApp):
     def __init__(self, server=None, **kwargs):
         super().__init__(server=get_server(server, client_type="vue3"), **kwargs)
 
+        self._last_contour_value = None
+
         # Initialize VTK, State, and UI
         self._initialize_vtk()
         self._initialize_state()
@@ -104,7 +114,7 @@ class ContourApp(TrameApp):
         self.reader.SetFileName(head_vti)
         self.reader.Update()
 
-        self.contour = vtkContourFilter()
+        self.contour = vtkFlyingEdges3D()
         self.contour.SetInputConnection(self.reader.GetOutputPort())
         self.contour.SetComputeNormals(1)
         self.contour.SetComputeScalars(0)
@@ -130,6 +140,8 @@ class ContourApp(TrameApp):
         data_range = self.reader.GetOutput().GetPointData().GetScalars().GetRange()
         contour_value = 0.5 * (data_range[0] + data_range[1])
 
+        self._contour_tolerance = CONTOUR_VALUE_TOLERANCE * (data_range[1] - data_range[0])
+
         self.state.trame__title = "VTK Remote/Local Contour"
         self.state.data_range = data_range
         self.state.contour_value = contour_value
@@ -138,7 +150,15 @@ class ContourApp(TrameApp):
 
     @change("contour_value")
     def update_contour(self, **kwargs):
-        self.contour.SetValue(0, self.state.contour_value)
+        contour_value = float(self.state.contour_value)
+        if (
+            self._last_contour_value is not None
+            and abs(contour_value - self._last_contour_value) < self._contour_tolerance
+        ):
+            return
+        self._last_contour_value = contour_value
+
+        self.contour.SetValue(0, contour_value)
         self.ctrl.view_update_image()  # For remote rendering
 
     def _build_ui(self):
@@ -162,6 +182,7 @@ class ContourApp(TrameApp):
                     v_model="contour_value",
                     min=self.state.data_range[0],
                     max=self.state.data_range[1],
+                    step=(self.state.data_range[1] - self.state.data_range[0]) / 100,
                     hide_details=True,
                     density="compact",
                     style="max-width: 300px",
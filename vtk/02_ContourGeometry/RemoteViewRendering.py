@@ -17,7 +17,7 @@
 #
 # **Key Features:**
 #
-# - **VTK Pipeline**: Loads `head.vti`, applies `vtkContourFilter`.
+# - **VTK Pipeline**: Loads `head.vti`, applies `vtkFlyingEdges3D`.
 # - **Remote Rendering**: Uses `VtkRemoteView` for displaying the VTK scene.
 # - **Interactive Isovalue**: `VSlider` controls the contour's isovalue.
 # - **Data-driven Slider**: Slider range is determined by the scalar range of the input data.
@@ -57,6 +57,9 @@
 #
 # --- End Usage Instructions ---
 
+import asyncio
+import os
+from collections import OrderedDict
 from pathlib import Path
 import vtk
 import numpy as np # For numerical operations if needed, e.g. data_range step
@@ -66,6 +69,12 @@ from trame.decorators import change
 from trame.ui.vuetify3 import SinglePageLayout
 from trame.widgets import vuetify3, vtk as vtk_widgets
 
+CONTOUR_UPDATE_INTERVAL = 1 / 60 # seconds; at most one contour update per display frame while dragging
+CONTOUR_CACHE_MAX_KB = 256 * 1024 # memory budget for cached contour surfaces
+CONTOUR_VALUE_TOLERANCE = 1 / 500 # fraction of the data range too small to see
+
+vtk.vtkSMPTools.SetBackend(os.environ.get("VTK_SMP_BACKEND_IN_USE", "STDThread"))
+
 # -----------------------------------------------------------------------------
 # VTK pipeline setup
 # -----------------------------------------------------------------------------
@@ -85,7 +94,7 @@ def create_vtk_pipeline():
     reader.SetFileName(str(head_vti_path))
     reader.Update()
 
-    contour_filter = vtk.vtkContourFilter()
+    contour_filter = vtk.vtkFlyingEdges3D()
     contour_filter.SetInputConnection(reader.GetOutputPort())
     contour_filter.SetComputeNormals(1)
     contour_filter.SetComputeScalars(0) # We'll use the actor's color
@@ -117,6 +126,11 @@ class ContourRemoteApp(TrameApp):
         self.contour_filter = vtk_parts["contour_filter"]
         self._scalar_range = vtk_parts["scalar_range"]
         self._initial_contour_value = vtk_parts["initial_contour_value"]
+        self._contour_handle = None
+        self._contour_cache = OrderedDict() # isovalue -> vtkPolyData, oldest first
+        self._contour_cache_kb = 0
+        self._contour_tolerance = CONTOUR_VALUE_TOLERANCE * (self._scalar_range[1] - self._scalar_range[0])
+        self._last_contour_value = None
 
         # VTK Rendering components
         self.renderer = vtk.vtkRenderer()
@@ -127,7 +141,7 @@ class ContourRemoteApp(TrameApp):
 
         self.mapper = vtk.vtkPolyDataMapper()
         self.actor = vtk.vtkActor()
-        self.mapper.SetInputConnection(self.contour_filter.GetOutputPort())
+        self.mapper.SetInputDataObject(self._contour_for(self._initial_contour_value))
         self.actor.SetMapper(self.mapper)
         self.actor.GetProperty().SetColor(0.2, 0.6, 0.9) # A pleasant blue
         self.renderer.AddActor(self.actor)
@@ -164,16 +178,60 @@ class ContourRemoteApp(TrameApp):
         else:
             self.state.contour_value = new_value # Ensure state reflects the value being set
 
-        self.contour_filter.SetValue(0, float(new_value))
-        self.contour_filter.Update()
+        new_value = float(new_value)
+        if (
+            self._last_contour_value is not None
+            and abs(new_value - self._last_contour_value) < self._contour_tolerance
+        ):
+            return # Too small a change to see; keep the current surface and image
+        self._last_contour_value = new_value
+
+        self.mapper.SetInputDataObject(self._contour_for(new_value))
         if hasattr(self.ctrl, 'view_update') and self.ctrl.view_update: # Check if view_update is bound by VtkRemoteView
             self.ctrl.view_update()
 
+    def _contour_for(self, value):
+        """Returns the contour surface for value, reusing it if it was computed recently."""
+        # Scrubbing back and forth revisits the same slider steps, so keep
+        # recent surfaces and only run the filter for new isovalues
+        key = round(float(value), 3)
+        contour = self._contour_cache.get(key)
+        if contour is not None:
+            self._contour_cache.move_to_end(key)
+            return contour
+
+        self.contour_filter.SetValue(0, key)
+        self.contour_filter.Update()
+        contour = vtk.vtkPolyData()
+        contour.ShallowCopy(self.contour_filter.GetOutput()) # The next Update() allocates new arrays
+        self._contour_cache[key] = contour
+        self._contour_cache_kb += contour.GetActualMemorySize()
+        while self._contour_cache_kb > CONTOUR_CACHE_MAX_KB and len(self._contour_cache) > 1:
+            _, evicted = self._contour_cache.popitem(last=False)
+            self._contour_cache_kb -= evicted.GetActualMemorySize()
+        return contour
+
     @change("contour_value")
     def _on_contour_value_change_interactive(self, contour_value, **kwargs):
         """Called when 'contour_value' state changes, for interactive updates."""
-        if self.state.interactive_update:
+        if not self.state.interactive_update:
+            return
+
+        # Slider drags emit a change per mouse move; recompute at most once
+        # per interval, always with the latest value
+        if self._contour_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
             self._update_contour_and_render(contour_value)
+            return
+        self._contour_handle = loop.call_later(CONTOUR_UPDATE_INTERVAL, self._flush_contour)
+
+    def _flush_contour(self):
+        self._contour_handle = None
+        with self.state:
+            self._update_contour_and_render()
 
     def commit_changes(self, value):
         """
@@ -237,6 +295,9 @@ class ContourRemoteApp(TrameApp):
                     view = vtk_widgets.VtkRemoteView(
                         self.render_window,
                         ref="view",
+                        interactive_quality=50, # Smaller JPEG frames while rotating
+                        interactive_ratio=1,
+                        still_quality=95,
                     )
                     self.ctrl.view_update = view.update
                     self.ctrl.view_reset_camera = view.reset_camera
@@ -21,6 +21,7 @@
 # - Independent camera controls for each view by default.
 # - Global control for cone resolution.
 # - Distinct background color for each view.
+# - All views are viewports of one render window, streamed as a single image.
 # - UI built with Trame 3 and Vuetify 3.
 
 # **Running if uv is available:**
@@ -95,36 +96,45 @@ class MultiViewApp(TrameApp):
         self.cone_source = vtkConeSource()
         self.mapper = vtkPolyDataMapper()
         self.mapper.SetInputConnection(self.cone_source.GetOutputPort())
+        # One actor shown by every renderer, so the cone is uploaded once
+        self.actor = vtkActor()
+        self.actor.SetMapper(self.mapper)
 
         self.colors = PALETTE + PALETTE  # 12 views
-        self.render_windows = []
-        self._html_views = [] # Store view widgets if needed for later reference
+        num_rows = len(self.colors) // NB_COLS
 
-        # Build VTK render windows and associated components
-        for color in self.colors:
-            actor = vtkActor()
-            actor.SetMapper(self.mapper)
+        # All views are viewports of one render window, so the server keeps a
+        # single OpenGL context and renders and streams a single image
+        self.render_window = vtkRenderWindow()
+        self.render_window.SetOffScreenRendering(1)
+        self.renderers = []
 
+        # Build one renderer per view, laid out row by row from the top left
+        for view_idx, color in enumerate(self.colors):
+            row_idx, col_idx = divmod(view_idx, NB_COLS)
             renderer = vtkRenderer()
             renderer.SetBackground(*color)
-            render_window = vtkRenderWindow()
-            render_window.AddRenderer(renderer)
-            render_window.SetOffScreenRendering(1)
-
-            # Setup interactor
-            render_window_interactor = vtkRenderWindowInteractor()
-            render_window_interactor.SetRenderWindow(render_window)
-            # The following line ensures that the interactor style is a vtkInteractorStyleSwitch
-            # which then allows setting specific styles like TrackballCamera.
-            render_window_interactor.Initialize() # Initialize is important
-            if render_window_interactor.GetInteractorStyle():
-                 render_window_interactor.GetInteractorStyle().SetCurrentStyleToTrackballCamera()
-
-            renderer.AddActor(actor)
+            renderer.SetViewport(
+                col_idx / NB_COLS,
+                1 - (row_idx + 1) / num_rows,
+                (col_idx + 1) / NB_COLS,
+                1 - row_idx / num_rows,
+            )
+            renderer.AddActor(self.actor)
             renderer.ResetCamera()
-            # render_window.Render() # Initial render can be deferred or handled by view updates
 
-            self.render_windows.append(render_window)
+            self.render_window.AddRenderer(renderer)
+            self.renderers.append(renderer)
+
+        # Setup interactor; mouse events go to the viewport under the pointer,
+        # so each view keeps its own camera
+        self.render_window_interactor = vtkRenderWindowInteractor()
+        self.render_window_interactor.SetRenderWindow(self.render_window)
+        # The following line ensures that the interactor style is a vtkInteractorStyleSwitch
+        # which then allows setting specific styles like TrackballCamera.
+        self.render_window_interactor.Initialize() # Initialize is important
+        if self.render_window_interactor.GetInteractorStyle():
+             self.render_window_interactor.GetInteractorStyle().SetCurrentStyleToTrackballCamera()
 
     def _initialize_state(self):
         self.state.trame__title = "VTK Multi-View Application"
@@ -137,6 +147,12 @@ class MultiViewApp(TrameApp):
         self.cone_source.SetResolution(int(resolution))
         self.ctrl.update_views()
 
+    def _reset_cameras(self):
+        # VtkRemoteView.reset_camera only resets the first renderer
+        for renderer in self.renderers:
+            renderer.ResetCamera()
+        self.ctrl.update_views()
+
     def _reset_resolution(self):
         self.state.resolution = DEFAULT_RESOLUTION
         # The @change decorator on resolution will trigger _on_resolution_change
@@ -144,7 +160,7 @@ class MultiViewApp(TrameApp):
     def _build_ui(self):
         with SinglePageLayout(self.server, full_height=True) as layout:
             layout.title.set_text("Multi-View Cone")
-            layout.icon.click = self.ctrl.reset_camera # Reset all views' cameras
+            layout.icon.click = self._reset_cameras # Reset all views' cameras
 
             with layout.toolbar:
                 vuetify.VSpacer()
@@ -163,34 +179,15 @@ class MultiViewApp(TrameApp):
                     vuetify.VIcon("mdi-undo-variant")
 
             with layout.content:
-                with vuetify.VContainer(fluid=True, classes="pa-0 bg-surface-variant fill-height"):
-                    num_render_windows = len(self.render_windows)
-                    if num_render_windows == 0:
-                        return # Or display a message
-
-                    num_rows = int(num_render_windows / NB_COLS)
-                    row_height_percent = 90.0 / num_rows if num_rows > 0 else 90.0
-
-                    for row_idx in range(num_rows):
-                        with vuetify.VRow(
-                            classes="pa-1 ma-1",
-                            style=f"height: {row_height_percent}%; width:100%;", # flex-shrink:0 is important
-                        ):
-                            for col_idx in range(NB_COLS):
-                                view_idx = row_idx * NB_COLS + col_idx
-                                if view_idx < num_render_windows:
-                                    render_window = self.render_windows[view_idx]
-                                    with vuetify.VCol(
-                                        classes="pa-1 ma-1",
-                                    ):
-                                        view = vtk_widgets.VtkRemoteView(
-                                            render_window,
-                                            ref=f"view{view_idx}",
-                                        )
-                                        self.ctrl.update_views.add(view.update)
-                                        self.ctrl.reset_camera.add(view.reset_camera)
-                                        self._html_views.append(view)
-
+                with vuetify.VContainer(fluid=True, classes="pa-0 fill-height"):
+                    view = vtk_widgets.VtkRemoteView(
+                        self.render_window,
+                        ref="view",
+                        interactive_quality=50, # Smaller JPEG frames while rotating
+                        interactive_ratio=1,
+                        still_quality=95,
+                    )
+                    self.ctrl.update_views = view.update
 
 
 def main():